@@ -16,8 +16,13 @@ Examples:
 import subprocess
 import sys
 import re
-from dataclasses import dataclass
-from typing import Optional
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Iterator, Optional
 
 
 # Paths to exclude from changelog (internal/admin stuff not visible to end users)
@@ -68,8 +73,37 @@ INTERNAL_PREFIXES = [
     "test",
 ]
 
-
-@dataclass
+# How many of the newest tags to scan before falling back to the full list
+RECENT_TAGS_LIMIT = 32
+
+# Precompiled unions of the lists above, so each subject/file is checked in
+# one regex call instead of a Python-level loop over every entry
+_INTERNAL_RE = re.compile(
+    "|".join(re.escape(p) for p in INTERNAL_PREFIXES), re.IGNORECASE
+)
+_EXCLUDED_RE = re.compile("|".join(re.escape(p) for p in EXCLUDED_PATHS))
+# Most excluded files match at the repo root; str.startswith(tuple) catches
+# those in C without touching the substring regex
+_EXCLUDED_PREFIXES = tuple(EXCLUDED_PATHS)
+
+# Subject prefix -> changelog category, for user-facing commits
+_CATEGORY_PREFIXES = {
+    "add": "features",
+    "feat": "features",
+    "fix": "fixes",
+    "improve": "improvements",
+    "enhance": "improvements",
+    "update": "improvements",
+    "optimize": "improvements",
+}
+# No key is a prefix of another, so the match maps back to a single category
+_CATEGORY_RE = re.compile("|".join(_CATEGORY_PREFIXES))
+
+_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+_RELEASE_BRANCH_RE = re.compile(r"release/v?(\d+\.\d+\.\d+)")
+
+
+@dataclass(slots=True)
 class Commit:
     hash: str
     author: str
@@ -78,6 +112,11 @@ class Commit:
     body: str
     files: list[str]
     is_internal: bool = False
+    subject_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Lowercased once here so categorization doesn't re-lower per check
+        self.subject_lower = self.subject.lower()
 
 
 def run_git(args: list[str]) -> str:
@@ -93,15 +132,56 @@ def run_git(args: list[str]) -> str:
     return result.stdout.strip()
 
 
-def get_tags() -> list[str]:
-    """Get all version tags sorted by version number."""
-    output = run_git(["tag", "--list", "v*", "--sort=-version:refname"])
-    return [t for t in output.split("\n") if t]
-
+def stream_git(args: list[str], separator: str) -> Iterator[str]:
+    """Run a git command and yield its output split on separator as it arrives.
 
+    Avoids holding the whole output in memory for large log ranges.
+    """
+    # stderr goes to a file rather than a pipe: a pipe nobody reads until
+    # stdout is drained could fill up and deadlock both processes
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            ["git"] + args,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            encoding="utf-8",
+        ) as proc:
+            pending = ""
+            for chunk in iter(lambda: proc.stdout.read(65536), ""):
+                pending += chunk
+                *records, pending = pending.split(separator)
+                yield from records
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"Git command failed: {stderr}")
+    if pending:
+        yield pending
+
+
+@lru_cache(maxsize=None)
+def get_tags(limit: Optional[int] = None) -> list[str]:
+    """Get version tags sorted by version number, newest first (cached per run).
+
+    If limit is given, only the newest `limit` tags are returned.
+    """
+    args = [
+        "for-each-ref",
+        "--sort=-v:refname",
+        "--format=%(refname:strip=2)",
+    ]
+    if limit is not None:
+        args.append(f"--count={limit}")
+    output = run_git(args + ["refs/tags/v*"])
+    return output.splitlines()
+
+
+@lru_cache(maxsize=None)
 def parse_version(tag: str) -> Optional[tuple[int, int, int]]:
     """Parse a version tag like v1.2.3 into (major, minor, patch)."""
-    match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", tag)
+    match = _VERSION_RE.match(tag)
     if match:
         return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
     return None
@@ -117,7 +197,7 @@ def get_current_branch() -> Optional[str]:
 
 def parse_release_branch(branch: str) -> Optional[str]:
     """Extract version from release branch name like 'release/v0.6.0'."""
-    match = re.match(r"release/v?(\d+\.\d+\.\d+)", branch)
+    match = _RELEASE_BRANCH_RE.match(branch)
     if match:
         return f"v{match.group(1)}"
     return None
@@ -146,8 +226,20 @@ def find_previous_minor_or_major(target_tag: str) -> Optional[str]:
         return None
 
     target_major, target_minor, _ = target_version
-    tags = get_tags()
 
+    # The previous minor/major is almost always among the newest tags; only
+    # list every tag if that batch is exhausted without a match
+    tags = get_tags(limit=RECENT_TAGS_LIMIT)
+    previous = _first_previous_minor_or_major(tags, target_major, target_minor)
+    if previous is None and len(tags) == RECENT_TAGS_LIMIT:
+        previous = _first_previous_minor_or_major(get_tags(), target_major, target_minor)
+    return previous
+
+
+def _first_previous_minor_or_major(
+    tags: list[str], target_major: int, target_minor: int
+) -> Optional[str]:
+    """Return the first x.y.0 tag in tags older than target_major.target_minor."""
     for tag in tags:
         version = parse_version(tag)
         if not version:
@@ -169,20 +261,32 @@ def find_previous_minor_or_major(target_tag: str) -> Optional[str]:
     return None
 
 
+def is_excluded_path(path: str) -> bool:
+    """Check if a file path falls under EXCLUDED_PATHS."""
+    # Cheap prefix test first; the substring regex only runs when it fails
+    if path.startswith(_EXCLUDED_PREFIXES):
+        return True
+    return _EXCLUDED_RE.search(path) is not None
+
+
+def is_internal_subject(subject: str) -> bool:
+    """Check if a commit subject starts with an internal prefix."""
+    return _INTERNAL_RE.match(subject) is not None
+
+
 def is_internal_commit(subject: str, files: list[str]) -> bool:
     """Check if a commit is internal (not user-facing)."""
     # Check subject prefix
-    subject_lower = subject.lower()
-    for prefix in INTERNAL_PREFIXES:
-        if subject_lower.startswith(prefix.lower()):
-            return True
+    if is_internal_subject(subject):
+        return True
+
+    # Single-file commits are the common case; skip the generator setup
+    if len(files) == 1:
+        return is_excluded_path(files[0])
 
     # Check if all changed files are in excluded paths
     if files:
-        all_internal = all(
-            any(f.startswith(excluded) or excluded in f for excluded in EXCLUDED_PATHS)
-            for f in files
-        )
+        all_internal = all(is_excluded_path(f) for f in files)
         if all_internal:
             return True
 
@@ -190,56 +294,45 @@ def is_internal_commit(subject: str, files: list[str]) -> bool:
 
 
 def get_commits(from_ref: str, to_ref: str) -> list[Commit]:
-    """Get all commits between two refs."""
-    # Get commit hashes
-    log_output = run_git([
+    """Get all commits between two refs.
+
+    Uses a single `git log` call: each record starts with \\x01, metadata
+    fields are NUL-separated and terminated by \\x02, followed by the
+    NUL-separated file list from --name-only.
+    """
+    records = stream_git([
         "log",
         f"{from_ref}..{to_ref}",
-        "--format=%H",
         "--no-merges",
-    ])
-
-    if not log_output:
-        return []
+        "-z",
+        "--name-only",
+        "--format=format:%x01%h%x00%an%x00%ci%x00%s%x00%b%x02",
+    ], "\x01")
 
     commits = []
-    for commit_hash in log_output.split("\n"):
-        if not commit_hash:
+    for record in records:
+        if not record:
             continue
 
-        # Get commit details
-        details = run_git([
-            "log",
-            "-1",
-            commit_hash,
-            "--format=%h%n%an%n%ci%n%s%n%b",
-        ])
-        lines = details.split("\n")
-
-        short_hash = lines[0]
-        author = lines[1]
-        date = lines[2].split()[0]  # Just the date part
-        subject = lines[3]
-        body = "\n".join(lines[4:]).strip()
-
-        # Get changed files
-        files_output = run_git([
-            "diff-tree",
-            "--no-commit-id",
-            "--name-only",
-            "-r",
-            commit_hash,
-        ])
-        files = [f for f in files_output.split("\n") if f]
-
-        is_internal = is_internal_commit(subject, files)
+        meta, _, files_output = record.partition("\x02")
+        short_hash, author, date, subject, body = meta.split("\x00", 4)
+
+        # Internal-by-subject commits are only listed by hash and subject,
+        # so skip parsing their body and file list
+        if is_internal_subject(subject):
+            body = ""
+            files = []
+            is_internal = True
+        else:
+            files = [f for f in files_output.strip("\n").split("\x00") if f]
+            is_internal = is_internal_commit(subject, files)
 
         commits.append(Commit(
             hash=short_hash,
             author=author,
-            date=date,
+            date=date.split()[0],  # Just the date part
             subject=subject,
-            body=body,
+            body=body.strip(),
             files=files,
             is_internal=is_internal,
         ))
@@ -262,105 +355,104 @@ def categorize_commits(commits: list[Commit]) -> dict[str, list[Commit]]:
             categories["internal"].append(commit)
             continue
 
-        subject_lower = commit.subject.lower()
-
-        if subject_lower.startswith("add") or subject_lower.startswith("feat"):
-            categories["features"].append(commit)
-        elif subject_lower.startswith("fix"):
-            categories["fixes"].append(commit)
-        elif any(subject_lower.startswith(p) for p in ["improve", "enhance", "update", "optimize"]):
-            categories["improvements"].append(commit)
-        else:
-            categories["other"].append(commit)
+        match = _CATEGORY_RE.match(commit.subject_lower)
+        category = _CATEGORY_PREFIXES[match.group()] if match else "other"
+        categories[category].append(commit)
 
     return categories
 
 
 def print_commits(from_ref: str, to_ref: str, commits: list[Commit], categories: dict):
     """Print commits in a structured format."""
-    from_date = run_git(["log", "-1", "--format=%ci", from_ref]).split()[0]
-    to_date = run_git(["log", "-1", "--format=%ci", to_ref]).split()[0]
+    # The two date lookups are independent; overlap their subprocess latency
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        from_date, to_date = (
+            output.split()[0]
+            for output in executor.map(
+                lambda ref: run_git(["log", "-1", "--format=%ci", ref]),
+                (from_ref, to_ref),
+            )
+        )
 
-    print("=" * 70)
-    print(f"CHANGELOG COMMITS: {from_ref} ({from_date}) -> {to_ref} ({to_date})")
-    print("=" * 70)
-    print()
+    # Collected and written once rather than one print() per line
+    out: list[str] = []
+    out.append("=" * 70)
+    out.append(f"CHANGELOG COMMITS: {from_ref} ({from_date}) -> {to_ref} ({to_date})")
+    out.append("=" * 70)
+    out.append("")
 
     user_facing = len(commits) - len(categories["internal"])
-    print(f"Total commits: {len(commits)}")
-    print(f"User-facing commits: {user_facing}")
-    print(f"Internal commits (excluded): {len(categories['internal'])}")
-    print()
+    out.append(f"Total commits: {len(commits)}")
+    out.append(f"User-facing commits: {user_facing}")
+    out.append(f"Internal commits (excluded): {len(categories['internal'])}")
+    out.append("")
 
-    print("=" * 70)
-    print("USER-FACING CHANGES (for changelog)")
-    print("=" * 70)
+    out.append("=" * 70)
+    out.append("USER-FACING CHANGES (for changelog)")
+    out.append("=" * 70)
 
     if categories["features"]:
-        print("\n### [NEW] Features")
+        out.append("\n### [NEW] Features")
         for c in categories["features"]:
-            print(f"  {c.hash} {c.subject}")
+            out.append(f"  {c.hash} {c.subject}")
             if c.body:
                 for line in c.body.split("\n")[:3]:
                     if line.strip():
-                        print(f"         {line.strip()}")
+                        out.append(f"         {line.strip()}")
 
     if categories["fixes"]:
-        print("\n### [FIX] Bug Fixes")
+        out.append("\n### [FIX] Bug Fixes")
         for c in categories["fixes"]:
-            print(f"  {c.hash} {c.subject}")
+            out.append(f"  {c.hash} {c.subject}")
 
     if categories["improvements"]:
-        print("\n### [IMP] Improvements")
+        out.append("\n### [IMP] Improvements")
         for c in categories["improvements"]:
-            print(f"  {c.hash} {c.subject}")
+            out.append(f"  {c.hash} {c.subject}")
 
     if categories["other"]:
-        print("\n### [OTHER] Other Changes")
+        out.append("\n### [OTHER] Other Changes")
         for c in categories["other"]:
-            print(f"  {c.hash} {c.subject}")
+            out.append(f"  {c.hash} {c.subject}")
 
-    print()
-    print("=" * 70)
-    print("INTERNAL CHANGES (excluded from changelog)")
-    print("=" * 70)
+    out.append("")
+    out.append("=" * 70)
+    out.append("INTERNAL CHANGES (excluded from changelog)")
+    out.append("=" * 70)
     if categories["internal"]:
         for c in categories["internal"]:
-            reason = "internal prefix" if any(
-                c.subject.lower().startswith(p.lower()) for p in INTERNAL_PREFIXES
-            ) else "internal files only"
-            print(f"  {c.hash} {c.subject} [{reason}]")
+            reason = (
+                "internal prefix" if is_internal_subject(c.subject)
+                else "internal files only"
+            )
+            out.append(f"  {c.hash} {c.subject} [{reason}]")
     else:
-        print("  (none)")
+        out.append("  (none)")
 
-    print()
-    print("=" * 70)
-    print("FILES CHANGED (user-facing commits only)")
-    print("=" * 70)
+    out.append("")
+    out.append("=" * 70)
+    out.append("FILES CHANGED (user-facing commits only)")
+    out.append("=" * 70)
 
-    all_files = set()
-    for cat_name, cat_commits in categories.items():
-        if cat_name == "internal":
-            continue
-        for c in cat_commits:
-            all_files.update(c.files)
+    all_files = set(chain.from_iterable(
+        c.files
+        for cat_name, cat_commits in categories.items()
+        if cat_name != "internal"
+        for c in cat_commits
+    ))
 
     # Group by directory
-    dirs: dict[str, int] = {}
-    for f in all_files:
-        if "/" in f:
-            dir_name = f.rsplit("/", 1)[0]
-        else:
-            dir_name = "."
-        dirs[dir_name] = dirs.get(dir_name, 0) + 1
+    dirs = Counter(f.rsplit("/", 1)[0] if "/" in f else "." for f in all_files)
+
+    for dir_name, count in dirs.most_common(15):
+        out.append(f"  {count:3d} {dir_name}/")
 
-    for dir_name, count in sorted(dirs.items(), key=lambda x: -x[1])[:15]:
-        print(f"  {count:3d} {dir_name}/")
+    out.append("")
+    out.append("=" * 70)
+    out.append("END OF CHANGELOG DATA")
+    out.append("=" * 70)
 
-    print()
-    print("=" * 70)
-    print("END OF CHANGELOG DATA")
-    print("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -2,15 +2,58 @@
 Dev Tracker API Client
 """
 
+import http.client
 import json
+import re
+import sys
+import threading
 import urllib.request
 import urllib.error
-from typing import Optional, List, Dict, Any
+from urllib.parse import urlencode, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Iterator, Optional, List, Dict, Any, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = None
+    fuzz_process = None
 
 from config import API_URL, get_headers, REQUEST_TIMEOUT, validate_config
 from git_utils import get_user_email
 
 
+# Concurrent create_task requests during batch import
+BATCH_CREATE_WORKERS = 8
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+# Deletion table for the ASCII characters _PUNCT_RE matches
+_ASCII_PUNCT_TABLE = {c: None for c in range(128) if _PUNCT_RE.match(chr(c))}
+
+
+# Relative batch import paths are resolved against the scripts directory
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Per-thread keep-alive connection to the API host, so consecutive requests
+# (e.g. the batch import's create calls) skip the TCP/TLS handshake
+_connections = threading.local()
+
+# http.client ignores proxy settings, so only keep connections alive when no
+# proxy is configured; otherwise every request goes through urllib
+_USE_KEEPALIVE = not urllib.request.getproxies()
+
+# Methods that are safe to resend if the server may already have handled them
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+
+
 class DevTrackerError(Exception):
     """Dev Tracker API Error"""
     pass
@@ -19,9 +62,10 @@ class DevTrackerError(Exception):
 def _make_request(
     method: str,
     endpoint: str,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Make an API request"""
+    """Make an API request, with optional query string params"""
     if not validate_config():
         raise DevTrackerError("Invalid configuration")
 
@@ -30,29 +74,100 @@ def _make_request(
         raise DevTrackerError("Could not determine git user email")
 
     url = f"{API_URL}/{endpoint}"
+    if params:
+        url = f"{url}?{urlencode(params)}"
     headers = get_headers(email)
 
     req_data = None
     if data:
         req_data = json.dumps(data).encode('utf-8')
 
+    status, reason, body = _send(method, url, req_data, headers)
+
+    if status >= 400:
+        error_body = body.decode('utf-8')
+        try:
+            error_data = json.loads(error_body)
+            raise DevTrackerError(error_data.get('error', f"HTTP Error {status}: {reason}"))
+        except json.JSONDecodeError:
+            raise DevTrackerError(f"HTTP {status}: {error_body}")
+
+    return json.loads(body.decode('utf-8'))
+
+
+def _send(
+    method: str,
+    url: str,
+    body: Optional[bytes],
+    headers: Dict[str, str]
+) -> Tuple[int, str, bytes]:
+    """Send a request and return (status, reason, body)"""
+    if _USE_KEEPALIVE:
+        status, reason, response_body = _send_keepalive(method, url, body, headers)
+        # Let urllib handle redirects
+        if not 300 <= status < 400:
+            return status, reason, response_body
+    return _send_urllib(method, url, body, headers)
+
+
+def _send_keepalive(
+    method: str,
+    url: str,
+    body: Optional[bytes],
+    headers: Dict[str, str]
+) -> Tuple[int, str, bytes]:
+    """Send a request over this thread's persistent connection"""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    for attempt in range(2):
+        conn = getattr(_connections, 'conn', None)
+        reused = conn is not None
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            conn = conn_class(parts.netloc, timeout=REQUEST_TIMEOUT)
+            _connections.conn = conn
+
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            sent = True
+            response = conn.getresponse()
+            return response.status, response.reason, response.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _connections.conn = None
+            # The server may have closed an idle keep-alive connection;
+            # retry once on a fresh one. Once the request went out the server
+            # may already have acted on it, so only idempotent methods resend
+            stale = isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError))
+            resendable = not sent or method in _IDEMPOTENT_METHODS
+            if reused and stale and resendable and attempt == 0:
+                continue
+            raise DevTrackerError(f"Connection error: {e}")
+
+    raise DevTrackerError("Connection error: retry failed")
+
+
+def _send_urllib(
+    method: str,
+    url: str,
+    body: Optional[bytes],
+    headers: Dict[str, str]
+) -> Tuple[int, str, bytes]:
+    """Send a one-off request through urllib (honours proxies and redirects)"""
     request = urllib.request.Request(
         url,
-        data=req_data,
+        data=body,
         headers=headers,
         method=method
     )
 
     try:
         with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-            return json.loads(response.read().decode('utf-8'))
+            return response.status, response.reason, response.read()
     except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            raise DevTrackerError(error_data.get('error', str(e)))
-        except json.JSONDecodeError:
-            raise DevTrackerError(f"HTTP {e.code}: {error_body}")
+        return e.code, e.reason, e.read()
     except urllib.error.URLError as e:
         raise DevTrackerError(f"Connection error: {e.reason}")
 
@@ -167,7 +282,7 @@ def get_my_tasks() -> List[Dict[str, Any]]:
     Returns:
         List of task objects
     """
-    result = _make_request('GET', 'tasks?my_tasks=true')
+    result = _make_request('GET', 'tasks', params={'my_tasks': 'true'})
     return result.get('tasks', [])
 
 
@@ -189,7 +304,7 @@ def get_backlog_tasks() -> List[Dict[str, Any]]:
     Returns:
         List of backlog task objects
     """
-    result = _make_request('GET', 'tasks?status=backlog')
+    result = _make_request('GET', 'tasks', params={'status': 'backlog'})
     return result.get('tasks', [])
 
 
@@ -262,9 +377,10 @@ def get_milestones(task_id: int) -> List[Dict[str, Any]]:
     return result.get('milestones', [])
 
 
+@lru_cache(maxsize=1)
 def get_categories() -> List[Dict[str, Any]]:
     """
-    Get all categories
+    Get all categories (cached for the lifetime of the process)
 
     Returns:
         List of category objects
@@ -273,6 +389,17 @@ def get_categories() -> List[Dict[str, Any]]:
     return result.get('categories', [])
 
 
+@lru_cache(maxsize=1)
+def get_category_map() -> Dict[str, Any]:
+    """
+    Get a case-folded category name to ID map (cached alongside get_categories)
+
+    Returns:
+        Dict mapping casefolded category name to category ID
+    """
+    return {cat.get('name', '').casefold(): cat.get('id') for cat in get_categories()}
+
+
 def create_category(name: str, color: str = '#6366f1') -> Dict[str, Any]:
     """
     Create a new category
@@ -290,6 +417,8 @@ def create_category(name: str, color: str = '#6366f1') -> Dict[str, Any]:
     }
 
     result = _make_request('POST', 'categories', data)
+    get_categories.cache_clear()
+    get_category_map.cache_clear()
     return result.get('category', result)
 
 
@@ -308,11 +437,11 @@ def get_releases(status: Optional[str] = None, limit: int = 50) -> List[Dict[str
     Returns:
         List of release objects
     """
-    params = f'?limit={limit}'
+    params: Dict[str, Any] = {'limit': limit}
     if status:
-        params += f'&status={status}'
+        params['status'] = status
 
-    result = _make_request('GET', f'releases{params}')
+    result = _make_request('GET', 'releases', params=params)
     return result.get('releases', [])
 
 
@@ -380,7 +509,12 @@ def get_all_active_and_backlog_tasks() -> List[Dict[str, Any]]:
     Returns:
         List of task objects that are not in 'deployed' status
     """
-    result = _make_request('GET', 'tasks')
+    # Ask the server to drop deployed tasks and trim each task to the fields
+    # duplicate detection reads; servers that ignore these params still work
+    result = _make_request('GET', 'tasks', params={
+        'exclude_status': 'deployed',
+        'fields': 'id,title,status',
+    })
     all_tasks = result.get('tasks', [])
     # Filter out deployed tasks - we want backlog, in_progress, ready_for_release, testing, ready_for_production
     return [t for t in all_tasks if t.get('status') != 'deployed']
@@ -388,54 +522,133 @@ def get_all_active_and_backlog_tasks() -> List[Dict[str, Any]]:
 
 def _normalize_title(title: str) -> str:
     """Normalize a title for comparison (lowercase, strip whitespace, remove punctuation)"""
-    import re
-    normalized = title.lower().strip()
-    # Remove common punctuation and extra whitespace
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized
+    normalized = title.lower()
+    # Remove punctuation - a single str.translate pass for ASCII titles
+    if normalized.isascii():
+        normalized = normalized.translate(_ASCII_PUNCT_TABLE)
+    else:
+        normalized = _PUNCT_RE.sub('', normalized)
+    # Strip and collapse whitespace
+    return ' '.join(normalized.split())
 
 
-def _find_duplicate_task(title: str, existing_tasks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def _build_duplicate_index(existing_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a lookup index over existing task titles for duplicate detection
+
+    Each title is normalized once. Exact matches become a dict lookup, and
+    titles are bucketed by normalized length so the substring check only
+    runs against titles whose length is within the 80% ratio.
+
+    Args:
+        existing_tasks: List of existing tasks to index
+
+    Returns:
+        Index to pass to _find_duplicate_task / _add_to_duplicate_index
+    """
+    index: Dict[str, Any] = {'exact': {}, 'by_length': {}, 'titles': [], 'tasks': []}
+    for task in existing_tasks:
+        _add_to_duplicate_index(index, task)
+    return index
+
+
+def _add_to_duplicate_index(index: Dict[str, Any], task: Dict[str, Any]) -> None:
+    """Add a task to a duplicate index built by _build_duplicate_index"""
+    normalized = _normalize_title(task.get('title', ''))
+    index['exact'].setdefault(normalized, task)
+    index['by_length'].setdefault(len(normalized), []).append((normalized, task))
+    # Parallel lists for the optional fuzzy scorer
+    index['titles'].append(normalized)
+    index['tasks'].append(task)
+
+
+def _find_duplicate_task(
+    title: str,
+    index: Dict[str, Any],
+    similarity_cutoff: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
     """
     Find if a task with similar title already exists
 
     Args:
         title: Title to check
-        existing_tasks: List of existing tasks to check against
+        index: Duplicate index of existing tasks (see _build_duplicate_index)
+        similarity_cutoff: Optional rapidfuzz token_set_ratio score (0-100).
+            When set, titles that pass neither the exact nor the substring
+            check are also matched if they score at least this high.
 
     Returns:
         Matching task if found, None otherwise
     """
     normalized_new = _normalize_title(title)
 
-    for task in existing_tasks:
-        existing_title = task.get('title', '')
-        normalized_existing = _normalize_title(existing_title)
-
-        # Check for exact match after normalization
-        if normalized_new == normalized_existing:
-            return task
-
-        # Check if one is a substring of the other (catches minor variations)
-        if normalized_new in normalized_existing or normalized_existing in normalized_new:
-            # Only match if they're at least 80% similar in length
-            len_ratio = min(len(normalized_new), len(normalized_existing)) / max(len(normalized_new), len(normalized_existing))
-            if len_ratio > 0.8:
+    # Check for exact match after normalization
+    task = index['exact'].get(normalized_new)
+    if task is not None:
+        return task
+
+    # Check if one is a substring of the other (catches minor variations).
+    # Only match if they're at least 80% similar in length, i.e.
+    # 5 * shorter > 4 * longer; the ranges below are that bound in integer
+    # form. Equal lengths would have been an exact match above.
+    len_new = len(normalized_new)
+    by_length = index['by_length']
+
+    # Shorter existing titles can only be contained in the new one
+    for len_existing in range(len_new * 4 // 5 + 1, len_new):
+        for normalized_existing, task in by_length.get(len_existing, ()):
+            if normalized_existing in normalized_new:
                 return task
 
+    # Longer existing titles can only contain the new one
+    for len_existing in range(len_new + 1, (len_new * 5 - 1) // 4 + 1):
+        for normalized_existing, task in by_length.get(len_existing, ()):
+            if normalized_new in normalized_existing:
+                return task
+
+    if similarity_cutoff is not None and index['titles']:
+        match = fuzz_process.extractOne(
+            normalized_new,
+            index['titles'],
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=similarity_cutoff
+        )
+        if match is not None:
+            return index['tasks'][match[2]]
+
     return None
 
 
-def batch_import_tasks(file_path: str = 'backlog.json') -> Dict[str, Any]:
+def _iter_tasks_file(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield task entries from the 'tasks' array of a JSON file
+
+    Streams the file with ijson when it is installed, so large backlogs are
+    never loaded into memory at once; falls back to json.load otherwise.
+    """
+    with file_path.open('rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'tasks.item')
+        else:
+            yield from json.load(f).get('tasks', [])
+
+
+def batch_import_tasks(
+    file_path: str = 'backlog.json',
+    similarity_cutoff: Optional[float] = None
+) -> Dict[str, Any]:
     """
     Import tasks from a JSON file in batch, skipping duplicates
 
     Args:
         file_path: Path to JSON file with tasks array
+        similarity_cutoff: Optional fuzzy match score (0-100) for duplicate
+            detection; requires the rapidfuzz package
 
     Returns:
-        Dict with 'created' (list of created tasks) and 'skipped' (list of skipped duplicates)
+        Dict with 'created' (list of created tasks), 'skipped' (list of
+        skipped duplicates) and 'failed' (titles and errors of tasks that
+        weren't created)
 
     JSON format:
     {
@@ -450,81 +663,134 @@ def batch_import_tasks(file_path: str = 'backlog.json') -> Dict[str, Any]:
         ]
     }
     """
-    import os
+    if similarity_cutoff is not None and fuzz is None:
+        raise DevTrackerError("--similarity-cutoff requires the rapidfuzz package (pip install rapidfuzz)")
 
     # Resolve path relative to script directory if not absolute
-    if not os.path.isabs(file_path):
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(script_dir, file_path)
+    path = Path(file_path)
+    if not path.is_absolute():
+        path = _SCRIPT_DIR / path
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    tasks_data = data.get('tasks', [])
-    if not tasks_data:
+    tasks_data = _iter_tasks_file(path)
+    first_task = next(tasks_data, None)
+    if first_task is None:
         raise DevTrackerError("No tasks found in JSON file")
 
-    # Get existing non-deployed tasks for duplicate detection
+    # Existing tasks and categories are independent lookups - fetch both at once
     print("Checking for duplicates...")
-    existing_tasks = get_all_active_and_backlog_tasks()
-    print(f"Found {len(existing_tasks)} existing non-deployed tasks")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        existing_future = executor.submit(get_all_active_and_backlog_tasks)
+        category_map_future = executor.submit(get_category_map)
+        existing_tasks = existing_future.result()
+        category_map = category_map_future.result()
 
-    # Get categories for name-to-id resolution
-    categories = get_categories()
-    category_map = {cat.get('name', '').lower(): cat.get('id') for cat in categories}
+    print(f"Found {len(existing_tasks)} existing non-deployed tasks")
+    duplicate_index = _build_duplicate_index(existing_tasks)
 
-    created_tasks = []
-    skipped_tasks = []
+    # Deduplicate locally first; only the create calls below hit the network.
+    # Tasks queued for creation are indexed as placeholders so duplicates
+    # within the same batch are caught too, and are filled in once created.
+    pending_tasks: List[Dict[str, Any]] = []
+    create_args: List[Dict[str, Any]] = []
+    duplicates = []
+    missing_categories: Dict[str, int] = {}
 
-    for task_item in tasks_data:
+    for task_item in chain([first_task], tasks_data):
         title = task_item.get('title')
         if not title:
             print(f"Skipping task with no title: {task_item}")
             continue
 
         # Check for duplicates
-        duplicate = _find_duplicate_task(title, existing_tasks)
+        duplicate = _find_duplicate_task(title, duplicate_index, similarity_cutoff)
         if duplicate:
-            skipped_tasks.append({
-                'title': title,
-                'existing_id': duplicate.get('id'),
-                'existing_title': duplicate.get('title'),
-                'existing_status': duplicate.get('status'),
-            })
-            print(f"Skipping duplicate: '{title}' (matches #{duplicate.get('id')}: '{duplicate.get('title')}')")
+            duplicates.append((title, duplicate))
+            if 'id' in duplicate:
+                print(f"Skipping duplicate: '{title}' (matches #{duplicate.get('id')}: '{duplicate.get('title')}')")
+            else:
+                print(f"Skipping duplicate: '{title}' (matches '{duplicate.get('title')}' earlier in this batch)")
             continue
 
         # Resolve category name to ID
         category_id = None
         category_name = task_item.get('category')
         if category_name:
-            category_id = category_map.get(category_name.lower())
+            category_id = category_map.get(category_name.casefold())
             if not category_id:
-                print(f"Warning: Category '{category_name}' not found, skipping category for task '{title}'")
-
-        task = create_task(
-            title=title,
-            description=task_item.get('description'),
-            category=category_id,
-            status='backlog',
-            priority=task_item.get('priority', 'medium'),
-            effort=task_item.get('effort', 'medium')
-        )
-        created_tasks.append(task)
-        # Add to existing tasks to prevent duplicates within the same batch
-        existing_tasks.append(task)
+                missing_categories[category_name] = missing_categories.get(category_name, 0) + 1
+
+        create_args.append({
+            'title': title,
+            'description': task_item.get('description'),
+            'category': category_id,
+            'status': 'backlog',
+            'priority': task_item.get('priority', 'medium'),
+            'effort': task_item.get('effort', 'medium'),
+        })
+        pending = {'title': title}
+        pending_tasks.append(pending)
+        # Add to the index to prevent duplicates within the same batch
+        _add_to_duplicate_index(duplicate_index, pending)
+
+    for category_name, count in missing_categories.items():
+        print(f"Warning: Category '{category_name}' not found, skipping category for {count} task(s)")
+
+    # Create tasks concurrently to overlap request round-trips. After the
+    # first failure no further creates are started; every task is reported
+    # as created or failed, in file order.
+    created_tasks = []
+    failed_tasks = []
+    if create_args:
+        stop = threading.Event()
+
+        def create(kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if stop.is_set():
+                return None
+            try:
+                return create_task(**kwargs)
+            except Exception:
+                stop.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=BATCH_CREATE_WORKERS) as executor:
+            futures = [executor.submit(create, kwargs) for kwargs in create_args]
+
+        for pending, future in zip(pending_tasks, futures):
+            error = future.exception()
+            if error is not None:
+                failed_tasks.append({'title': pending['title'], 'error': str(error)})
+                continue
+            task = future.result()
+            if task is None:
+                failed_tasks.append({'title': pending['title'], 'error': 'not attempted after an earlier failure'})
+                continue
+            pending.update(task)
+            created_tasks.append(task)
+
+    skipped_tasks = [
+        {
+            'title': title,
+            'existing_id': duplicate.get('id'),
+            'existing_title': duplicate.get('title'),
+            'existing_status': duplicate.get('status'),
+        }
+        for title, duplicate in duplicates
+    ]
 
     return {
         'created': created_tasks,
         'skipped': skipped_tasks,
+        'failed': failed_tasks,
     }
 
 
-if __name__ == '__main__':
-    import sys
+# ============================================================================
+# CLI
+# ============================================================================
 
-    def print_usage():
-        print("""Dev Tracker CLI
+def _print_usage() -> None:
+    """Print CLI usage"""
+    print("""Dev Tracker CLI
 
 Usage: python api.py <command> [args]
 
@@ -537,163 +803,234 @@ Commands:
   update <id> <status> [summary] Update task status
   delete <id>                    Delete a task
   categories                     List categories
-  batch [file]                   Import tasks from JSON file (default: backlog.json)
+  batch [file] [--similarity-cutoff <0-100>]
+                                 Import tasks from JSON file (default: backlog.json)
   test                           Test API connection
 """)
 
-    args = sys.argv[1:]
-    if not args:
-        print_usage()
-        sys.exit(0)
 
-    cmd = args[0]
+def _cmd_tasks(args: List[str]) -> None:
+    """List my tasks"""
+    tasks = get_my_tasks()
+    if not tasks:
+        print("No tasks assigned to you")
+    for task in tasks:
+        print(f"[{task.get('id')}] {task.get('title')} ({task.get('status')})")
+
+
+def _cmd_active(args: List[str]) -> None:
+    """List all active tasks (conflict detection)"""
+    active = get_all_active_tasks()
+    if not active:
+        print("No active tasks")
+    for task in active:
+        assignee = task.get('assignee', {})
+        email = assignee.get('email', 'unassigned') if assignee else 'unassigned'
+        print(f"[{task.get('id')}] {task.get('title')} (by {email})")
+
+
+def _cmd_create(args: List[str]) -> None:
+    """Create a new task"""
+    if len(args) < 2:
+        print("Usage: python api.py create <title> [description] [--category <name>] [--priority <value>] [--effort <value>]")
+        print("  --category: Dashboard, Candidates, Clients, Jobs, etc.")
+        print("  --priority: low, medium, high, critical")
+        print("  --effort: tiny, small, medium, large, massive")
+        sys.exit(1)
 
-    try:
-        if cmd == 'tasks':
-            tasks = get_my_tasks()
-            if not tasks:
-                print("No tasks assigned to you")
-            for task in tasks:
-                print(f"[{task.get('id')}] {task.get('title')} ({task.get('status')})")
-
-        elif cmd == 'active':
-            active = get_all_active_tasks()
-            if not active:
-                print("No active tasks")
-            for task in active:
-                assignee = task.get('assignee', {})
-                email = assignee.get('email', 'unassigned') if assignee else 'unassigned'
-                print(f"[{task.get('id')}] {task.get('title')} (by {email})")
-
-        elif cmd == 'create':
-            if len(args) < 2:
-                print("Usage: python api.py create <title> [description] [--category <name>] [--priority <value>] [--effort <value>]")
-                print("  --category: Dashboard, Candidates, Clients, Jobs, etc.")
-                print("  --priority: low, medium, high, critical")
-                print("  --effort: tiny, small, medium, large, massive")
-                sys.exit(1)
+    # Parse positional and optional arguments
+    title = None
+    description = None
+    category_name = None
+    priority = None
+    effort = None
+
+    i = 1
+    positional_args = []
+    while i < len(args):
+        if args[i] == '--category' and i + 1 < len(args):
+            category_name = args[i + 1]
+            i += 2
+        elif args[i] == '--priority' and i + 1 < len(args):
+            priority = args[i + 1]
+            i += 2
+        elif args[i] == '--effort' and i + 1 < len(args):
+            effort = args[i + 1]
+            i += 2
+        elif not args[i].startswith('--'):
+            positional_args.append(args[i])
+            i += 1
+        else:
+            i += 1
 
-            # Parse positional and optional arguments
-            title = None
-            description = None
-            category_name = None
-            priority = None
-            effort = None
-
-            i = 1
-            positional_args = []
-            while i < len(args):
-                if args[i] == '--category' and i + 1 < len(args):
-                    category_name = args[i + 1]
-                    i += 2
-                elif args[i] == '--priority' and i + 1 < len(args):
-                    priority = args[i + 1]
-                    i += 2
-                elif args[i] == '--effort' and i + 1 < len(args):
-                    effort = args[i + 1]
-                    i += 2
-                elif not args[i].startswith('--'):
-                    positional_args.append(args[i])
-                    i += 1
-                else:
-                    i += 1
-
-            if not positional_args:
-                print("Error: title is required")
-                sys.exit(1)
+    if not positional_args:
+        print("Error: title is required")
+        sys.exit(1)
 
-            title = positional_args[0]
-            description = positional_args[1] if len(positional_args) > 1 else None
-
-            # Resolve category name to ID
-            category_id = None
-            if category_name:
-                categories = get_categories()
-                category_map = {cat.get('name', '').lower(): cat.get('id') for cat in categories}
-                category_id = category_map.get(category_name.lower())
-                if not category_id:
-                    print(f"Warning: Category '{category_name}' not found")
-
-            result = create_task(title, description, category=category_id, priority=priority, effort=effort)
-            task = result
-            print(f"Created task #{task.get('id')}: {task.get('title')}")
-            if category_name:
-                print(f"  Category: {category_name}")
-            if priority:
-                print(f"  Priority: {priority}")
-            if effort:
-                print(f"  Effort: {effort}")
-
-        elif cmd == 'heartbeat':
-            if len(args) < 3:
-                print("Usage: python api.py heartbeat <task_id> <progress> [note]")
-                sys.exit(1)
-            task_id = int(args[1])
-            progress = int(args[2])
-            note = args[3] if len(args) > 3 else None
-            send_heartbeat(task_id, progress, note)
-            print(f"Heartbeat sent for task #{task_id} (progress: {progress}%)")
-
-        elif cmd == 'update':
-            if len(args) < 3:
-                print("Usage: python api.py update <task_id> <status> [summary]")
+    title = positional_args[0]
+    description = positional_args[1] if len(positional_args) > 1 else None
+
+    # Resolve category name to ID
+    category_id = None
+    if category_name:
+        category_id = get_category_map().get(category_name.casefold())
+        if not category_id:
+            print(f"Warning: Category '{category_name}' not found")
+
+    result = create_task(title, description, category=category_id, priority=priority, effort=effort)
+    task = result
+    print(f"Created task #{task.get('id')}: {task.get('title')}")
+    if category_name:
+        print(f"  Category: {category_name}")
+    if priority:
+        print(f"  Priority: {priority}")
+    if effort:
+        print(f"  Effort: {effort}")
+
+
+def _cmd_heartbeat(args: List[str]) -> None:
+    """Send heartbeat for task"""
+    if len(args) < 3:
+        print("Usage: python api.py heartbeat <task_id> <progress> [note]")
+        sys.exit(1)
+    task_id = int(args[1])
+    progress = int(args[2])
+    note = args[3] if len(args) > 3 else None
+    send_heartbeat(task_id, progress, note)
+    print(f"Heartbeat sent for task #{task_id} (progress: {progress}%)")
+
+
+def _cmd_update(args: List[str]) -> None:
+    """Update task status"""
+    if len(args) < 3:
+        print("Usage: python api.py update <task_id> <status> [summary]")
+        sys.exit(1)
+    task_id = int(args[1])
+    status = args[2]
+    summary = args[3] if len(args) > 3 else None
+    update_task(task_id, status=status, summary=summary)
+    print(f"Updated task #{task_id} to {status}")
+
+
+def _cmd_delete(args: List[str]) -> None:
+    """Delete a task"""
+    if len(args) < 2:
+        print("Usage: python api.py delete <task_id>")
+        sys.exit(1)
+    task_id = int(args[1])
+    delete_task(task_id)
+    print(f"Deleted task #{task_id}")
+
+
+def _cmd_backlog(args: List[str]) -> None:
+    """List backlog tasks"""
+    tasks = get_backlog_tasks()
+    if not tasks:
+        print("No backlog tasks")
+    for task in tasks:
+        priority = task.get('priority', 'medium')
+        effort = task.get('effort', 'medium')
+        print(f"[{task.get('id')}] {task.get('title')} (P:{priority} E:{effort})")
+
+
+def _cmd_categories(args: List[str]) -> None:
+    """List categories"""
+    categories = get_categories()
+    for cat in categories:
+        print(f"  {cat.get('name')}")
+
+
+def _cmd_batch(args: List[str]) -> None:
+    """Import tasks from JSON file"""
+    file_path = 'backlog.json'
+    similarity_cutoff = None
+
+    i = 1
+    while i < len(args):
+        if args[i] == '--similarity-cutoff':
+            if i + 1 >= len(args):
+                print("Missing --similarity-cutoff value: must be a number from 0 to 100")
                 sys.exit(1)
-            task_id = int(args[1])
-            status = args[2]
-            summary = args[3] if len(args) > 3 else None
-            result = update_task(task_id, status=status, summary=summary)
-            print(f"Updated task #{task_id} to {status}")
-
-        elif cmd == 'delete':
-            if len(args) < 2:
-                print("Usage: python api.py delete <task_id>")
+            value = args[i + 1]
+            try:
+                similarity_cutoff = float(value)
+            except ValueError:
+                similarity_cutoff = None
+            # rapidfuzz scores run from 0 to 100 (NaN fails both checks)
+            if similarity_cutoff is None or not 0 <= similarity_cutoff <= 100:
+                print(f"Invalid --similarity-cutoff '{value}': must be a number from 0 to 100")
                 sys.exit(1)
-            task_id = int(args[1])
-            delete_task(task_id)
-            print(f"Deleted task #{task_id}")
-
-        elif cmd == 'backlog':
-            tasks = get_backlog_tasks()
-            if not tasks:
-                print("No backlog tasks")
-            for task in tasks:
-                priority = task.get('priority', 'medium')
-                effort = task.get('effort', 'medium')
-                print(f"[{task.get('id')}] {task.get('title')} (P:{priority} E:{effort})")
-
-        elif cmd == 'categories':
-            categories = get_categories()
-            for cat in categories:
-                print(f"  {cat.get('name')}")
-
-        elif cmd == 'batch':
-            file_path = args[1] if len(args) > 1 else 'backlog.json'
-            print(f"Importing tasks from {file_path}...")
-            result = batch_import_tasks(file_path)
-            created = result.get('created', [])
-            skipped = result.get('skipped', [])
-
-            if created:
-                task_ids = [f"#{t.get('id')}" for t in created]
-                print(f"Created {len(created)} backlog tasks ({', '.join(task_ids)})")
-            else:
-                print("No new tasks created")
+            i += 2
+        else:
+            if not args[i].startswith('--'):
+                file_path = args[i]
+            i += 1
+
+    print(f"Importing tasks from {file_path}...")
+    result = batch_import_tasks(file_path, similarity_cutoff)
+    created = result.get('created', [])
+    skipped = result.get('skipped', [])
+    failed = result.get('failed', [])
+
+    if created:
+        task_ids = [f"#{t.get('id')}" for t in created]
+        print(f"Created {len(created)} backlog tasks ({', '.join(task_ids)})")
+    else:
+        print("No new tasks created")
+
+    if skipped:
+        print(f"Skipped {len(skipped)} duplicates:")
+        for s in skipped:
+            print(f"  - '{s['title']}' (matches #{s['existing_id']}: '{s['existing_title']}' [{s['existing_status']}])")
+
+    if failed:
+        print(f"Failed to create {len(failed)} tasks:")
+        for f in failed:
+            print(f"  - '{f['title']}': {f['error']}")
+        sys.exit(1)
 
-            if skipped:
-                print(f"Skipped {len(skipped)} duplicates:")
-                for s in skipped:
-                    print(f"  - '{s['title']}' (matches #{s['existing_id']}: '{s['existing_title']}' [{s['existing_status']}])")
 
-        elif cmd == 'test':
-            print("Testing Dev Tracker API...")
-            tasks = get_my_tasks()
-            print(f"Connection OK. You have {len(tasks)} task(s).")
+def _cmd_test(args: List[str]) -> None:
+    """Test API connection"""
+    print("Testing Dev Tracker API...")
+    tasks = get_my_tasks()
+    print(f"Connection OK. You have {len(tasks)} task(s).")
 
-        else:
-            print(f"Unknown command: {cmd}")
-            print_usage()
-            sys.exit(1)
 
+COMMANDS = {
+    'tasks': _cmd_tasks,
+    'active': _cmd_active,
+    'create': _cmd_create,
+    'heartbeat': _cmd_heartbeat,
+    'update': _cmd_update,
+    'delete': _cmd_delete,
+    'backlog': _cmd_backlog,
+    'categories': _cmd_categories,
+    'batch': _cmd_batch,
+    'test': _cmd_test,
+}
+
+
+def main() -> None:
+    """CLI entry point"""
+    args = sys.argv[1:]
+    if not args:
+        _print_usage()
+        sys.exit(0)
+
+    cmd = args[0]
+    handler = COMMANDS.get(cmd)
+    if handler is None:
+        print(f"Unknown command: {cmd}")
+        _print_usage()
+        sys.exit(1)
+
+    try:
+        handler(args)
     except DevTrackerError as e:
         print(f"Error: {e}")
         sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
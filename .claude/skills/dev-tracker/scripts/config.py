@@ -16,17 +16,13 @@ def _load_env_file() -> None:
     if not env_path.exists():
         return
 
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#') or '=' not in line:
-                continue
-            key, _, value = line.partition('=')
-            key = key.strip()
-            value = value.strip()
-            # Don't override existing env vars
-            if key not in os.environ:
-                os.environ[key] = value
+    for line in env_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line[0] == '#' or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        # Don't override existing env vars
+        os.environ.setdefault(key.strip(), value.strip())
 
 
 _load_env_file()
@@ -4,7 +4,9 @@ Git Utilities for Dev Tracker
 
 import os
 import subprocess
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional, List, Dict
 
 
 def run_git_command(args: List[str]) -> Optional[str]:
@@ -14,6 +16,7 @@ def run_git_command(args: List[str]) -> Optional[str]:
             ['git'] + args,
             capture_output=True,
             text=True,
+            encoding='utf-8',
             timeout=10
         )
         if result.returncode == 0:
@@ -23,6 +26,22 @@ def run_git_command(args: List[str]) -> Optional[str]:
         return None
 
 
+def run_git_command_bytes(args: List[str]) -> Optional[bytes]:
+    """Run a git command and return raw, unstripped stdout bytes"""
+    try:
+        result = subprocess.run(
+            ['git'] + args,
+            capture_output=True,
+            timeout=10
+        )
+        if result.returncode == 0:
+            return result.stdout
+        return None
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+
+
+@lru_cache(maxsize=1)
 def get_user_email() -> Optional[str]:
     """Get the developer email from env var or git config"""
     # Prefer explicit env var over git config
@@ -32,83 +51,125 @@ def get_user_email() -> Optional[str]:
     return run_git_command(['config', 'user.email'])
 
 
+@lru_cache(maxsize=1)
 def get_user_name() -> Optional[str]:
     """Get the configured git user name"""
     return run_git_command(['config', 'user.name'])
 
 
+@lru_cache(maxsize=1)
 def get_current_branch() -> Optional[str]:
-    """Get the current git branch name"""
+    """Get the current git branch name (cached; clear after switching branches)"""
     return run_git_command(['branch', '--show-current'])
 
 
 def get_recent_commits(count: int = 5) -> List[Dict[str, str]]:
     """Get recent commits with hash, message, and author"""
+    # NUL-separated fields and records (-z) so subjects containing '|' or
+    # other punctuation can't break the parse
     output = run_git_command([
         'log',
+        '-z',
         f'-{count}',
-        '--pretty=format:%H|%s|%ae|%ar'
+        '--pretty=format:%H%x00%s%x00%ae%x00%ar'
     ])
 
     if not output:
         return []
 
-    commits = []
-    for line in output.split('\n'):
-        parts = line.split('|', 3)
-        if len(parts) == 4:
-            commits.append({
-                'hash': parts[0],
-                'message': parts[1],
-                'author_email': parts[2],
-                'relative_time': parts[3],
-            })
-
-    return commits
+    fields = output.split('\x00')
+    return [
+        {
+            'hash': fields[i],
+            'message': fields[i + 1],
+            'author_email': fields[i + 2],
+            'relative_time': fields[i + 3],
+        }
+        for i in range(0, len(fields) - 3, 4)
+    ]
 
 
 def get_changed_files() -> List[str]:
     """Get list of currently changed files (staged and unstaged)"""
-    output = run_git_command(['status', '--porcelain'])
+    # Porcelain v2 with -z: NUL-terminated records, paths never quoted
+    output = run_git_command_bytes(['status', '--porcelain=v2', '-z'])
 
     if not output:
         return []
 
     files = []
-    for line in output.split('\n'):
-        if line:
-            # Format is: XY filename
-            # Skip the status characters
-            filename = line[3:].strip()
-            files.append(filename)
+    records = iter(output.split(b'\x00'))
+    for record in records:
+        kind = record[:1]
+        if kind == b'1':
+            # 1 XY sub mH mI mW hH hI path
+            path = record.split(b' ', 8)[8]
+        elif kind == b'2':
+            # 2 XY sub mH mI mW hH hI Xscore path, then the original path
+            path = record.split(b' ', 9)[9]
+            next(records, None)
+        elif kind == b'u':
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            path = record.split(b' ', 10)[10]
+        elif kind in (b'?', b'!'):
+            path = record[2:]
+        else:
+            continue
+        files.append(os.fsdecode(path))
 
     return files
 
 
 def get_staged_files() -> List[str]:
     """Get list of staged files"""
-    output = run_git_command(['diff', '--cached', '--name-only'])
+    output = run_git_command_bytes(['diff', '--cached', '--name-only', '-z'])
 
     if not output:
         return []
 
-    return output.split('\n')
+    return [os.fsdecode(path) for path in output.split(b'\x00') if path]
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Optional[str]:
     """Get the root directory of the git repository"""
     return run_git_command(['rev-parse', '--show-toplevel'])
 
 
+@lru_cache(maxsize=1)
 def get_remote_url() -> Optional[str]:
     """Get the remote origin URL"""
     return run_git_command(['remote', 'get-url', 'origin'])
 
 
+def get_git_context(commit_count: int = 3) -> Dict[str, Any]:
+    """
+    Get user, branch, working tree and recent commit info together
+
+    The underlying git calls are independent, so they run concurrently
+    rather than spawning one git process after another.
+    """
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        email = executor.submit(get_user_email)
+        name = executor.submit(get_user_name)
+        branch = executor.submit(get_current_branch)
+        changed_files = executor.submit(get_changed_files)
+        recent_commits = executor.submit(get_recent_commits, commit_count)
+
+        return {
+            'email': email.result(),
+            'name': name.result(),
+            'branch': branch.result(),
+            'changed_files': changed_files.result(),
+            'recent_commits': recent_commits.result(),
+        }
+
+
 if __name__ == '__main__':
     # Test the utilities
-    print(f"Email: {get_user_email()}")
-    print(f"Name: {get_user_name()}")
-    print(f"Branch: {get_current_branch()}")
-    print(f"Changed files: {get_changed_files()}")
-    print(f"Recent commits: {get_recent_commits(3)}")
+    context = get_git_context(3)
+    print(f"Email: {context['email']}")
+    print(f"Name: {context['name']}")
+    print(f"Branch: {context['branch']}")
+    print(f"Changed files: {context['changed_files']}")
+    print(f"Recent commits: {context['recent_commits']}")
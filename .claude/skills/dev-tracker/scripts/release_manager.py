@@ -2,10 +2,18 @@
 Release Manager - Git and API operations for release management
 """
 
+import atexit
+import json
+import os
+import shutil
 import subprocess
 import sys
 import re
-from typing import Optional, Tuple, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict, Any, Set
 
 from api import (
     create_release as api_create_release,
@@ -19,62 +27,264 @@ from api import (
 )
 from git_utils import get_current_branch, get_user_email
 
+if TYPE_CHECKING:
+    import argparse
+
+
+# Resolve git once so each spawn execs it directly instead of searching PATH
+_GIT = shutil.which('git') or 'git'
+
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(?:-[a-zA-Z0-9.-]+)?$')
+
+# API calls that failed after their git side succeeded, replayed on the next run
+_RETRY_QUEUE_PATH = Path.home() / '.elivro' / 'retry' / 'pending.jsonl'
+_RETRY_MAX_ATTEMPTS = 5
+# Commands that write to Dev Tracker; only these replay the retry queue
+_WRITE_COMMANDS = {'create', 'complete', 'mark-ready'}
+
+_FEATURE_PREFIXES = ('feature/', 'fix/', 'hotfix/', 'bugfix/')
+_RELEASE_PREFIX = 'release/'
+
 
 class ReleaseError(Exception):
     """Release operation error"""
     pass
 
 
-def run_git(args: List[str], check: bool = True) -> Tuple[int, str, str]:
+def run_git(
+    args: List[str],
+    check: bool = True,
+    strip: bool = True,
+    capture: bool = True
+) -> Tuple[int, str, str]:
     """
     Run a git command and return (returncode, stdout, stderr)
+
+    Pass strip=False to keep stdout verbatim, e.g. for formats where
+    leading whitespace is significant. Pass capture=False when only the
+    return code matters; output is then discarded and returned as ''.
     """
     try:
+        if not capture:
+            result = subprocess.run(
+                [_GIT] + args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60
+            )
+            if check and result.returncode != 0:
+                raise ReleaseError(f"Git command failed: git {' '.join(args)}")
+            return result.returncode, '', ''
+
+        # Capture bytes and decode once: git output is UTF-8 regardless of
+        # locale, and there are no newlines worth translating
         result = subprocess.run(
-            ['git'] + args,
+            [_GIT] + args,
             capture_output=True,
-            text=True,
             timeout=60
         )
+        stdout = result.stdout.decode('utf-8', 'replace')
+        stderr = result.stderr.decode('utf-8', 'replace')
         if check and result.returncode != 0:
-            raise ReleaseError(f"Git command failed: git {' '.join(args)}\n{result.stderr}")
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
+            raise ReleaseError(f"Git command failed: git {' '.join(args)}\n{stderr}")
+        if strip:
+            stdout = stdout.strip()
+        return result.returncode, stdout, stderr.strip()
     except subprocess.TimeoutExpired:
         raise ReleaseError(f"Git command timed out: git {' '.join(args)}")
 
 
+class _GitBatchProcess:
+    """
+    Long-running `git cat-file --batch-check` process for read-only ref lookups
+
+    Started on first use and reused for every lookup afterwards, so checking
+    whether a ref exists costs a pipe round-trip instead of a git exec.
+    Refs are resolved on each query, so lookups see branches created or
+    deleted by other git commands in the meantime.
+    """
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def ref_exists(self, ref: str) -> bool:
+        """Check whether a fully qualified ref (e.g. refs/heads/main) exists"""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = subprocess.Popen(
+                    [_GIT, 'cat-file', '--batch-check=%(objectname)'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding='utf-8'
+                )
+            self._process.stdin.write(f'{ref}\n')
+            self._process.stdin.flush()
+            line = self._process.stdout.readline()
+
+        if not line:
+            raise ReleaseError(f"git cat-file exited while looking up {ref}")
+        # Missing objects are reported as "<ref> missing"
+        return not line.rstrip('\n').endswith(' missing')
+
+    def close(self) -> None:
+        """Stop the helper process, if running"""
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()
+                self._process.wait()
+                self._process = None
+
+
+_git_batch = _GitBatchProcess()
+
+
 def validate_semver(version: str) -> bool:
     """Validate semantic version format"""
-    pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?$'
-    return bool(re.match(pattern, version))
+    return _SEMVER_RE.match(version) is not None
 
 
 def get_uncommitted_changes() -> List[str]:
     """Get list of uncommitted changes"""
-    _, stdout, _ = run_git(['status', '--porcelain'])
-    if not stdout:
-        return []
-    return [line for line in stdout.split('\n') if line.strip()]
+    # NUL-delimited entries are parsed as-is: no quoting of unusual paths,
+    # and the leading space of an unstaged-only status code survives
+    # --no-optional-locks: don't take index.lock to write back refreshed
+    # stat info, so status never contends with a concurrent git command
+    _, stdout, _ = run_git(['--no-optional-locks', 'status', '--porcelain=v1', '-z'], strip=False)
+    entries = iter(stdout.split('\x00'))
+    changes = []
+    for entry in entries:
+        if not entry:
+            continue
+        # Renames and copies are followed by a separate original-path entry
+        if entry[0] in 'RC' or entry[1] in 'RC':
+            changes.append(f"{entry[:3]}{next(entries, '')} -> {entry[3:]}")
+        else:
+            changes.append(entry)
+    return changes
 
 
 def is_feature_branch(branch: str) -> bool:
     """Check if branch is a feature branch"""
-    prefixes = ('feature/', 'fix/', 'hotfix/', 'bugfix/')
-    return branch.startswith(prefixes)
+    return branch.startswith(_FEATURE_PREFIXES)
+
+
+def release_branch_name(version: str) -> str:
+    """Get the release branch name for a version"""
+    return f'{_RELEASE_PREFIX}{version}'
 
 
 def branch_exists(branch: str, remote: bool = False) -> bool:
     """Check if a branch exists"""
     if remote:
-        code, _, _ = run_git(['show-ref', '--verify', '--quiet', f'refs/remotes/origin/{branch}'], check=False)
-    else:
-        code, _, _ = run_git(['show-ref', '--verify', '--quiet', f'refs/heads/{branch}'], check=False)
-    return code == 0
+        return _git_batch.ref_exists(f'refs/remotes/origin/{branch}')
+    return _git_batch.ref_exists(f'refs/heads/{branch}')
+
+
+def _checkout(branch: str, start_point: Optional[str] = None, check: bool = True) -> int:
+    """
+    Check out a branch, creating it from start_point if given
+
+    Always use this rather than run_git(['checkout', ...]) so the cached
+    current branch can't go stale.
+    """
+    args = ['checkout', '-b', branch, start_point] if start_point else ['checkout', branch]
+    try:
+        # A checkout that may fail is only judged by its return code
+        code, _, _ = run_git(args, check=check, capture=check)
+    finally:
+        get_current_branch.cache_clear()
+    return code
+
+
+def list_remote_heads() -> Set[str]:
+    """Get the branch names on origin in one `git ls-remote` round-trip"""
+    _, stdout, _ = run_git(['ls-remote', '--heads', 'origin'])
+    return {
+        line.split('\t', 1)[1][len('refs/heads/'):]
+        for line in stdout.splitlines()
+    }
 
 
 def fetch_origin() -> None:
     """Fetch latest from origin"""
-    run_git(['fetch', 'origin'])
+    # --jobs lets git fetch submodules in parallel
+    run_git(['fetch', f'--jobs={os.cpu_count() or 4}', 'origin'])
+
+
+def _enqueue_retry(action: str, kwargs: Dict[str, Any]) -> bool:
+    """Queue a failed API call for replay; returns False if it couldn't be saved"""
+    entry = {'action': action, 'kwargs': kwargs, 'attempts': 1}
+    try:
+        _RETRY_QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _RETRY_QUEUE_PATH.open('a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+    except OSError:
+        return False
+    return True
+
+
+def replay_pending_api_calls() -> List[str]:
+    """
+    Retry API calls queued by earlier runs
+
+    Entries that still fail stay queued until they have been attempted
+    _RETRY_MAX_ATTEMPTS times.
+
+    Returns:
+        Messages describing what was replayed
+    """
+    try:
+        lines = _RETRY_QUEUE_PATH.read_text(encoding='utf-8').splitlines()
+    except FileNotFoundError:
+        return []
+
+    messages = []
+    remaining = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            action, kwargs = entry['action'], entry['kwargs']
+            entry['attempts'] = int(entry['attempts'])
+            if not isinstance(kwargs, dict):
+                raise TypeError('kwargs is not an object')
+        except (ValueError, KeyError, TypeError) as e:
+            # A truncated or hand-edited line must not block every later run
+            messages.append(f"Dropped malformed queued API call ({e}): {line[:200]}")
+            continue
+        if action != 'create_release':
+            messages.append(f"Dropped unknown queued API call: {action}")
+            continue
+        try:
+            api_create_release(**kwargs)
+            messages.append(f"Retried queued {action} {kwargs}: succeeded")
+        except Exception as e:
+            # Not only DevTrackerError: any failure leaves the rest of the
+            # queue to be replayed and rewritten
+            entry['attempts'] += 1
+            if entry['attempts'] >= _RETRY_MAX_ATTEMPTS:
+                messages.append(f"Gave up on queued {action} {kwargs} after {entry['attempts']} attempts: {e}")
+            else:
+                messages.append(f"Queued {action} {kwargs} failed again, will retry: {e}")
+                remaining.append(entry)
+
+    # Queue bookkeeping must never abort the command that triggered the replay
+    try:
+        if remaining:
+            _RETRY_QUEUE_PATH.write_text(
+                ''.join(json.dumps(entry) + '\n' for entry in remaining),
+                encoding='utf-8'
+            )
+        else:
+            _RETRY_QUEUE_PATH.unlink(missing_ok=True)
+    except OSError as e:
+        messages.append(f"Could not update retry queue {_RETRY_QUEUE_PATH}: {e}")
+    return messages
 
 
 def create_release(
@@ -98,7 +308,7 @@ def create_release(
     result = {
         'success': False,
         'version': version,
-        'branch': f'release/{version}',
+        'branch': release_branch_name(version),
         'actions': [],
         'tasks': [],
         'errors': [],
@@ -111,29 +321,52 @@ def create_release(
 
     result['actions'].append(f"Validated version: {version}")
 
-    # Check for uncommitted changes
-    changes = get_uncommitted_changes()
-    if changes:
-        if auto_commit:
-            result['actions'].append(f"Found {len(changes)} uncommitted changes - will commit first")
-        else:
-            result['errors'].append(f"Uncommitted changes detected. Commit or stash them first.")
-            result['uncommitted'] = changes
-            return result
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The fetch is network-bound and independent of the local status
+        # check, so run it in the background unless the status check can
+        # still abort the release
+        fetch_future = executor.submit(fetch_origin) if auto_commit and not dry_run else None
+
+        # Check for uncommitted changes
+        changes = get_uncommitted_changes()
+        if changes:
+            if auto_commit:
+                result['actions'].append(f"Found {len(changes)} uncommitted changes - will commit first")
+            else:
+                result['errors'].append(f"Uncommitted changes detected. Commit or stash them first.")
+                result['uncommitted'] = changes
+                return result
+
+        # Fetch origin
+        if fetch_future is not None:
+            fetch_future.result()
+        elif not dry_run:
+            fetch_origin()
+        result['actions'].append("Fetched origin")
 
-    # Fetch origin
-    if not dry_run:
-        fetch_origin()
-    result['actions'].append("Fetched origin")
+    release_branch = release_branch_name(version)
+
+    # A dry run doesn't fetch, so ask origin directly instead of trusting
+    # possibly stale remote-tracking refs
+    remote_heads = None
+    if dry_run:
+        try:
+            remote_heads = list_remote_heads()
+        except ReleaseError:
+            pass
+
+    def remote_branch_exists(branch: str) -> bool:
+        if remote_heads is not None:
+            return branch in remote_heads
+        return branch_exists(branch, remote=True)
 
     # Check if release branch already exists
-    release_branch = f'release/{version}'
-    if branch_exists(release_branch) or branch_exists(release_branch, remote=True):
+    if branch_exists(release_branch) or remote_branch_exists(release_branch):
         result['errors'].append(f"Release branch {release_branch} already exists")
         return result
 
     # Check if develop exists
-    if not branch_exists('develop', remote=True):
+    if not remote_branch_exists('develop'):
         result['errors'].append("Remote branch origin/develop does not exist")
         return result
 
@@ -147,7 +380,7 @@ def create_release(
 
     # Create release branch from origin/develop
     try:
-        run_git(['checkout', '-b', release_branch, 'origin/develop'])
+        _checkout(release_branch, 'origin/develop')
         result['actions'].append(f"Created branch: {release_branch}")
     except ReleaseError as e:
         result['errors'].append(str(e))
@@ -160,8 +393,8 @@ def create_release(
     except ReleaseError as e:
         result['errors'].append(f"Failed to push: {e}")
         # Try to cleanup
-        run_git(['checkout', 'develop'], check=False)
-        run_git(['branch', '-D', release_branch], check=False)
+        _checkout('develop', check=False)
+        run_git(['branch', '-D', release_branch], check=False, capture=False)
         return result
 
     # Call API to create release
@@ -176,6 +409,8 @@ def create_release(
         result['actions'].append("Release branch created but API call failed")
         # Branch exists but API failed - partial success
         result['partial'] = True
+        if _enqueue_retry('create_release', {'version': version, 'title': title}):
+            result['actions'].append("Queued the Dev Tracker release for retry on the next run")
 
     return result
 
@@ -224,7 +459,7 @@ def complete_release(
     result['release'] = release
     result['actions'].append(f"Found release: {version}")
 
-    release_branch = f'release/{version}'
+    release_branch = release_branch_name(version)
 
     if dry_run:
         result['actions'].append(f"[DRY RUN] Would mark release {version} as deployed")
@@ -235,43 +470,55 @@ def complete_release(
         result['success'] = True
         return result
 
-    # Call API to complete release
-    try:
-        api_result = api_complete_release(version=version)
-        result['tasks'] = api_result.get('tasks', [])
-        result['deployed_at'] = api_result.get('release', {}).get('deployedAt')
-        result['actions'].append(f"Marked release as deployed: {len(result['tasks'])} tasks completed")
-    except DevTrackerError as e:
-        result['errors'].append(f"API error: {e}")
-        return result
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Fetch ahead of the merge while the API call is in flight
+        fetch_future = executor.submit(fetch_origin) if merge_to_main else None
+
+        # Call API to complete release
+        try:
+            api_result = api_complete_release(version=version)
+            result['tasks'] = api_result.get('tasks', [])
+            result['deployed_at'] = api_result.get('release', {}).get('deployedAt')
+            result['actions'].append(f"Marked release as deployed: {len(result['tasks'])} tasks completed")
+        except DevTrackerError as e:
+            result['errors'].append(f"API error: {e}")
+            return result
 
     # Optional: Merge to main
     if merge_to_main:
         try:
-            fetch_origin()
+            fetch_future.result()
             current_branch = get_current_branch()
 
-            # Merge to main
-            run_git(['checkout', 'main'])
-            run_git(['pull', 'origin', 'main'])
+            # Origin was just fetched, so fast-forward from the
+            # remote-tracking branches instead of pulling again
+
+            # Merge to main and tag the release
+            tag = f'v{version}'
+            _checkout('main')
+            run_git(['merge', '--ff-only', 'origin/main'])
             run_git(['merge', '--no-ff', release_branch, '-m', f'Merge release {version}'])
-            run_git(['push', 'origin', 'main'])
-            result['actions'].append(f"Merged {release_branch} to main")
+            run_git(['tag', '-a', tag, '-m', f'Release {version}'])
 
-            # Tag the release
-            run_git(['tag', '-a', f'v{version}', '-m', f'Release {version}'])
-            run_git(['push', 'origin', f'v{version}'])
-            result['actions'].append(f"Created tag: v{version}")
+            # Push main and the tag together; drop the local tag if that
+            # fails so a retry can recreate it
+            try:
+                run_git(['push', '--atomic', 'origin', 'main', tag])
+            except ReleaseError:
+                run_git(['tag', '-d', tag], check=False, capture=False)
+                raise
+            result['actions'].append(f"Merged {release_branch} to main")
+            result['actions'].append(f"Created tag: {tag}")
 
             # Merge back to develop
-            run_git(['checkout', 'develop'])
-            run_git(['pull', 'origin', 'develop'])
+            _checkout('develop')
+            run_git(['merge', '--ff-only', 'origin/develop'])
             run_git(['merge', '--no-ff', release_branch, '-m', f'Merge release {version} back to develop'])
             run_git(['push', 'origin', 'develop'])
             result['actions'].append(f"Merged {release_branch} back to develop")
 
             # Return to original branch
-            run_git(['checkout', current_branch], check=False)
+            _checkout(current_branch, check=False)
 
         except ReleaseError as e:
             result['errors'].append(f"Git merge error: {e}")
@@ -280,8 +527,8 @@ def complete_release(
     # Optional: Delete branch
     if delete_branch and not result['errors']:
         try:
-            run_git(['branch', '-d', release_branch], check=False)
-            run_git(['push', 'origin', '--delete', release_branch], check=False)
+            run_git(['branch', '-d', release_branch], check=False, capture=False)
+            run_git(['push', 'origin', '--delete', release_branch], check=False, capture=False)
             result['actions'].append(f"Deleted branch: {release_branch}")
         except ReleaseError:
             result['actions'].append(f"Could not delete branch: {release_branch}")
@@ -379,15 +626,16 @@ def mark_task_ready(
                 fetch_origin()
 
                 # Push current branch first
-                run_git(['push', '-u', 'origin', current_branch], check=False)
+                run_git(['push', '-u', 'origin', current_branch], check=False, capture=False)
                 result['actions'].append(f"Pushed {current_branch} to origin")
 
-                # Switch to develop
+                # Switch to develop, fast-forwarding from the origin/develop
+                # just fetched rather than pulling again
                 if not branch_exists('develop'):
-                    run_git(['checkout', '-b', 'develop', 'origin/develop'])
+                    _checkout('develop', 'origin/develop')
                 else:
-                    run_git(['checkout', 'develop'])
-                    run_git(['pull', 'origin', 'develop'])
+                    _checkout('develop')
+                    run_git(['merge', '--ff-only', 'origin/develop'])
 
                 # Merge feature branch
                 run_git(['merge', '--no-ff', current_branch, '-m', f'Merge {current_branch} into develop'])
@@ -399,8 +647,8 @@ def mark_task_ready(
 
                 # Delete feature branch if requested
                 if delete_feature_branch:
-                    run_git(['branch', '-d', current_branch], check=False)
-                    run_git(['push', 'origin', '--delete', current_branch], check=False)
+                    run_git(['branch', '-d', current_branch], check=False, capture=False)
+                    run_git(['push', 'origin', '--delete', current_branch], check=False, capture=False)
                     result['actions'].append(f"Deleted feature branch: {current_branch}")
                     result['branch_deleted'] = True
                 else:
@@ -410,7 +658,7 @@ def mark_task_ready(
             except ReleaseError as e:
                 result['errors'].append(f"Merge failed: {e}")
                 # Try to return to original branch
-                run_git(['checkout', current_branch], check=False)
+                _checkout(current_branch, check=False)
                 return result
     elif not result['is_feature_branch']:
         # On develop or other branch - just push
@@ -428,61 +676,67 @@ def mark_task_ready(
         result['success'] = True
         return result
 
+    # The milestone records the status change, so it is only logged once the
+    # update has gone through
     try:
-        update_data = {'status': 'ready_for_release'}
-        if summary:
-            update_data['summary'] = summary
-
         update_task(task_id, status='ready_for_release', summary=summary)
         result['actions'].append(f"Updated task {task_id} to ready_for_release")
-
-        log_milestone(task_id, 'status_changed', 'Marked as ready for release')
-        result['actions'].append("Logged milestone")
-
-        result['success'] = True
     except DevTrackerError as e:
         result['errors'].append(f"API error: {e}")
         result['actions'].append("Git operations completed but task update failed")
         result['partial'] = True
+        return result
+
+    # The task is ready either way; a missing milestone is only reported
+    result['success'] = True
+    try:
+        log_milestone(task_id, 'status_changed', 'Marked as ready for release')
+        result['actions'].append("Logged milestone")
+    except DevTrackerError as e:
+        result['errors'].append(f"Task updated but milestone logging failed: {e}")
 
     return result
 
 
 def print_result(result: Dict[str, Any], operation: str) -> None:
     """Print operation result in a formatted way"""
-    print(f"\n{'=' * 50}")
-    print(f"{operation.upper()}")
-    print('=' * 50)
+    # Build the report and write it in one go rather than one print per line
+    lines = [
+        '',
+        '=' * 50,
+        operation.upper(),
+        '=' * 50,
+    ]
 
     if result.get('success'):
-        print("✓ SUCCESS")
+        lines.append("✓ SUCCESS")
     elif result.get('partial'):
-        print("⚠ PARTIAL SUCCESS")
+        lines.append("⚠ PARTIAL SUCCESS")
     else:
-        print("✗ FAILED")
+        lines.append("✗ FAILED")
 
-    print(f"\nVersion: {result.get('version', 'N/A')}")
+    lines.append(f"\nVersion: {result.get('version', 'N/A')}")
 
     if result.get('actions'):
-        print("\nActions:")
-        for action in result['actions']:
-            print(f"  • {action}")
+        lines.append("\nActions:")
+        lines.extend(f"  • {action}" for action in result['actions'])
 
     if result.get('tasks'):
-        print(f"\nTasks ({len(result['tasks'])}):")
-        for task in result['tasks']:
-            print(f"  • [{task.get('id')}] {task.get('title')}")
+        lines.append(f"\nTasks ({len(result['tasks'])}):")
+        lines.extend(f"  • [{task.get('id')}] {task.get('title')}" for task in result['tasks'])
 
     if result.get('errors'):
-        print("\nErrors:")
-        for error in result['errors']:
-            print(f"  ✗ {error}")
+        lines.append("\nErrors:")
+        lines.extend(f"  ✗ {error}" for error in result['errors'])
 
-    print()
+    lines.append('')
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
-def main():
-    """CLI entry point"""
+@lru_cache(maxsize=1)
+def _build_parser() -> 'argparse.ArgumentParser':
+    """Build the CLI argument parser (once per process)"""
     import argparse
 
     parser = argparse.ArgumentParser(description='Release Manager')
@@ -511,9 +765,20 @@ def main():
     ready_parser.add_argument('--dry-run', action='store_true', help='Show what would happen')
 
     # status command
-    status_parser = subparsers.add_parser('status', help='Show release status')
+    subparsers.add_parser('status', help='Show release status')
+
+    return parser
 
-    args = parser.parse_args()
+
+def main(argv: Optional[List[str]] = None):
+    """CLI entry point"""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    # Never write queued calls from read-only commands or dry runs
+    if args.command in _WRITE_COMMANDS and not getattr(args, 'dry_run', False):
+        for message in replay_pending_api_calls():
+            print(message)
 
     if args.command == 'create':
         result = create_release(
@@ -544,9 +809,19 @@ def main():
         print_result(result, 'Mark Ready')
 
     elif args.command == 'status':
+        # Independent API calls - fetch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            active_future = executor.submit(get_active_release)
+            releases_future = executor.submit(get_releases, limit=5)
+            try:
+                active = active_future.result()
+                releases = releases_future.result()
+            except DevTrackerError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+
         print("\n=== RELEASE STATUS ===\n")
 
-        active = get_active_release()
         if active:
             print(f"Active Release: {active['version']}")
             print(f"  Status: {active['status']}")
@@ -554,10 +829,10 @@ def main():
             print("No active release in testing")
 
         print("\nRecent Releases:")
-        releases = get_releases(limit=5)
         for r in releases:
             status_icon = "🚀" if r['status'] == 'deployed' else "🧪"
             print(f"  {status_icon} {r['version']} ({r['status']}) - {r.get('taskCount', 0)} tasks")
+        result = {'success': True}
 
     else:
         parser.print_help()
@@ -1,6 +1,6 @@
 """Entry point for ElivroImagine."""
 
-import argparse
+import os
 import sys
 
 from typing import TYPE_CHECKING
@@ -8,6 +8,17 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .splash import SplashScreen
 
+# The CLI has a single flag, so it is parsed by hand rather than pulling in
+# argparse (and gettext/textwrap) on every start
+USAGE = """usage: {prog} [-h] [--install]
+
+ElivroImagine - Voice to Backlog tool
+
+options:
+  -h, --help  show this help message and exit
+  --install   Create Start Menu shortcut and exit
+"""
+
 
 def _set_windows_app_id() -> None:
     """Set Windows App User Model ID for proper taskbar/notification identity."""
@@ -25,22 +36,26 @@ def _set_windows_app_id() -> None:
         pass  # Non-critical, continue without custom app ID
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     # Set Windows app identity early
     _set_windows_app_id()
-    parser = argparse.ArgumentParser(
-        description="ElivroImagine - Voice to Backlog tool"
-    )
-    parser.add_argument(
-        "--install",
-        action="store_true",
-        help="Create Start Menu shortcut and exit",
-    )
-
-    args = parser.parse_args()
-
-    if args.install:
+
+    args = sys.argv[1:] if argv is None else argv
+    prog = os.path.basename(sys.argv[0])
+    install = False
+    for arg in args:
+        if arg in ("-h", "--help"):
+            print(USAGE.format(prog=prog), end="")
+            return 0
+        if arg == "--install":
+            install = True
+        else:
+            print(f"usage: {prog} [-h] [--install]", file=sys.stderr)
+            print(f"{prog}: error: unrecognized arguments: {arg}", file=sys.stderr)
+            return 2
+
+    if install:
         if sys.platform != "win32":
             print("--install is only supported on Windows")
             return 1
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 
@@ -26,11 +32,31 @@ from .utils import SingleInstanceLock
 
 if TYPE_CHECKING:
     from .splash import SplashScreen
+    from .windows import WindowsStartupManager
 
 logger = logging.getLogger(__name__)
 
-# Max concurrent transcription threads
-MAX_TRANSCRIPTION_WORKERS = 2
+# Shortest recording worth transcribing (seconds)
+MIN_RECORDING_SECONDS = 0.5
+
+# RMS level (-60 dBFS) below which a recording is treated as silence
+SILENCE_RMS_THRESHOLD = 10 ** (-60 / 20)
+
+
+def _is_silent(audio: np.ndarray) -> bool:
+    """Check if a float32 recording is below the silence threshold.
+
+    Args:
+        audio: Mono float32 samples in [-1, 1].
+
+    Returns:
+        True if the recording's RMS level is below SILENCE_RMS_THRESHOLD.
+    """
+    if audio.size == 0:
+        return True
+    # dot() computes the sum of squares without a squared temporary array
+    mean_square = float(np.dot(audio, audio)) / audio.size
+    return mean_square < SILENCE_RMS_THRESHOLD**2
 
 
 class ElivroImagineApp:
@@ -62,10 +88,14 @@ class ElivroImagineApp:
             print("ElivroImagine is already running.")
             sys.exit(1)
 
-        # Thread pool for bounded concurrent transcriptions
-        self._transcription_pool = ThreadPoolExecutor(
-            max_workers=MAX_TRANSCRIPTION_WORKERS,
-            thread_name_prefix="transcription",
+        # Bounds concurrent transcriptions (see _collect_and_dispatch). The
+        # local model gets the same number of workers, so these really run
+        # in parallel; applied at startup only.
+        self._transcription_workers = min(
+            self.config.transcription.max_workers, os.cpu_count() or 1
+        )
+        self._transcription_sem = threading.BoundedSemaphore(
+            self._transcription_workers
         )
 
         # Initialize components with error handling
@@ -97,6 +127,7 @@ class ElivroImagineApp:
         # Recording ownership: prevents multiple hotkeys from recording simultaneously
         self._recording_lock = threading.Lock()
         self._active_recording_source: str | None = None  # "save", "paste", or "devtracker"
+        self._recording_stopping = False  # Stop armed, audio not yet collected
 
         # Set up save hotkey listener
         self._update_splash("Configuring hotkeys...")
@@ -148,7 +179,8 @@ class ElivroImagineApp:
 
         # Set up system tray
         self._update_splash("Setting up system tray...")
-        transcriptions_folder = (
+        # Resolved once; re-resolved only when the storage path changes
+        self._transcriptions_folder = (
             self.storage.get_transcriptions_folder()
             if self.storage
             else self.config.storage.transcriptions_path
@@ -158,7 +190,7 @@ class ElivroImagineApp:
             lambda: SystemTray(
                 on_settings=self._show_settings,
                 on_quit=self._quit,
-                transcriptions_folder=transcriptions_folder,
+                transcriptions_folder=self._transcriptions_folder,
             ),
         )
 
@@ -167,9 +199,32 @@ class ElivroImagineApp:
             self.recorder.set_status_callback(self._on_recorder_status)
 
         self._running = False
+        self._shutdown_event = threading.Event()  # Set by _quit() to release run()
+        # Settings windows run on one long-lived worker, started on first open
         self._settings_thread: threading.Thread | None = None
+        self._settings_wake = threading.Event()
+        self._settings_lock = threading.Lock()
+        self._settings_open = False
+        self._settings_window: SettingsWindow | None = None  # Currently open
+        self._startup_manager: WindowsStartupManager | None = None  # Win32, lazy
+        self._last_autostart_value: bool | None = None  # Last applied autostart
         self._model_ready = threading.Event()  # Signals when model is loaded
         self._hotkey_capture_active = False  # Blocks recordings during settings capture
+        self._refresh_cached_config()
+
+    def _refresh_cached_config(self) -> None:
+        """Snapshot the config values read on every recording cycle.
+
+        Called at startup and whenever settings are saved, so the hotkey and
+        transcription threads read plain attributes instead of walking
+        self.config mid-swap.
+        """
+        config = self.config
+        self._sample_rate = config.recording.sample_rate
+        self._sound_enabled = config.sound.enabled
+        self._start_vol = config.sound.start_volume
+        self._stop_vol = config.sound.stop_volume
+        self._devtracker_project = config.devtracker_hotkey.project
 
     def _update_splash(self, message: str) -> None:
         """Update splash screen message and process UI events.
@@ -198,19 +253,41 @@ class ElivroImagineApp:
             return None
 
     def _setup_logging(self) -> None:
-        """Set up logging configuration."""
+        """Set up logging configuration.
+
+        Records are formatted by the caller and queued; a listener thread
+        does the file and console writes, so hotkey and recording callbacks
+        never block on disk I/O.
+        """
+        self._log_listener: logging.handlers.QueueListener | None = None
+        # Like basicConfig(), leave an already configured root logger alone
+        if logging.getLogger().handlers:
+            return
+
         log_dir = self.config.get_config_dir() / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "elivroimagine.log"
 
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue,
+            logging.FileHandler(log_file, encoding="utf-8"),
+            logging.StreamHandler(sys.stdout),
+        )
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler(log_file, encoding="utf-8"),
-                logging.StreamHandler(sys.stdout),
-            ],
+            handlers=[logging.handlers.QueueHandler(log_queue)],
         )
+        self._log_listener.start()
+        # Flush queued records even if the app exits without _quit()
+        atexit.register(self._stop_log_listener)
+
+    def _stop_log_listener(self) -> None:
+        """Write out queued log records and stop the listener thread."""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
 
     def run(self) -> None:
         """Run the application."""
@@ -242,30 +319,32 @@ class ElivroImagineApp:
 
         # Don't close splash here - it closes when model finishes loading
         # For non-local backends or if transcriber is disabled, close now
+        splash_close_at: float | None = None
         if not self.transcriber or self.config.transcription.backend != "local":
             if self._splash:
                 self._splash.set_progress(100)
                 self._splash.update_message("Ready to cook!")
                 self._splash.update()
-                import time
-                time.sleep(0.3)
-                self._splash.close()
-                self._splash = None
+                # Finish startup while "Ready" shows; close before blocking
+                splash_close_at = time.monotonic() + 0.3
 
         logger.info(
-            f"ElivroImagine running. Hotkey: {self.config.hotkey.combination} "
-            f"(mode: {self.config.hotkey.mode})"
+            "ElivroImagine running. Hotkey: %s (mode: %s)",
+            self.config.hotkey.combination,
+            self.config.hotkey.mode,
         )
         if self.paste_hotkey:
             logger.info(
-                f"Paste hotkey: {self.config.paste_hotkey.combination} "
-                f"(mode: {self.config.paste_hotkey.mode})"
+                "Paste hotkey: %s (mode: %s)",
+                self.config.paste_hotkey.combination,
+                self.config.paste_hotkey.mode,
             )
         if self.devtracker_hotkey:
             logger.info(
-                f"DevTracker hotkey: {self.config.devtracker_hotkey.combination} "
-                f"(mode: {self.config.devtracker_hotkey.mode}, "
-                f"project: {self.config.devtracker_hotkey.project})"
+                "DevTracker hotkey: %s (mode: %s, project: %s)",
+                self.config.devtracker_hotkey.combination,
+                self.config.devtracker_hotkey.mode,
+                self.config.devtracker_hotkey.project,
             )
 
         # First-run welcome notification
@@ -290,10 +369,18 @@ class ElivroImagineApp:
                 f"Running with limited functionality: {', '.join(degraded)} unavailable",
             )
 
-        # Keep main thread alive
+        # The splash is a Tk window owned by this thread, so close it here
+        if splash_close_at is not None and self._splash:
+            time.sleep(max(0.0, splash_close_at - time.monotonic()))
+            self._close_splash(self._splash)
+            self._splash = None
+
+        # Keep main thread alive until _quit(). Windows only delivers Ctrl+C
+        # between waits, so poll there; elsewhere block without waking up.
+        wait_timeout = 1.0 if sys.platform == "win32" else None
         try:
-            while self._running:
-                threading.Event().wait(1)
+            while not self._shutdown_event.wait(wait_timeout):
+                pass
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
             self._quit()
@@ -320,13 +407,9 @@ class ElivroImagineApp:
                     self._splash.set_progress(100)
                     self._splash.update_message("Ready to cook!")
                     self._splash.update()
-                    # Small delay to show "Ready" message
-                    import time
-                    time.sleep(0.5)
-                    self._splash.close()
                 except Exception:
                     pass  # Splash may already be closed
-                self._splash = None
+                self._schedule_splash_close(0.5)
 
             # Notify user if model failed to load
             if model_error and self.tray:
@@ -335,9 +418,34 @@ class ElivroImagineApp:
                     f"Model failed to load: {model_error[:50]}"
                 )
 
+    def _schedule_splash_close(self, delay: float) -> None:
+        """Close the splash after a short delay without blocking the caller.
+
+        Used from the model preload thread. The delay keeps the "Ready"
+        message visible; the splash is detached immediately so no further
+        updates are sent to it.
+
+        Args:
+            delay: Seconds to keep the splash visible.
+        """
+        splash, self._splash = self._splash, None
+        if splash is None:
+            return
+        timer = threading.Timer(delay, self._close_splash, args=(splash,))
+        timer.daemon = True
+        timer.start()
+
+    @staticmethod
+    def _close_splash(splash: SplashScreen) -> None:
+        """Close a splash screen, ignoring one that is already gone."""
+        try:
+            splash.close()
+        except Exception:
+            pass  # Splash may already be closed
+
     def _on_model_progress(self, message: str) -> None:
         """Handle model loading progress updates."""
-        logger.info(f"Model: {message}")
+        logger.info("Model: %s", message)
         # Forward to splash screen if still visible
         if self._splash:
             self._splash.update_message(message)
@@ -372,23 +480,24 @@ class ElivroImagineApp:
         with self._recording_lock:
             if self._active_recording_source is not None:
                 logger.warning(
-                    f"Recording blocked: already recording for "
-                    f"'{self._active_recording_source}'"
+                    "Recording blocked: already recording for '%s'",
+                    self._active_recording_source,
                 )
                 return False
             self._active_recording_source = source
 
-        logger.info(f"Recording started (source: {source})")
-        config = self.config  # Atomic reference read
-        if config.sound.enabled:
-            play_start_sound(config.sound.start_volume)
+        logger.info("Recording started (source: %s)", source)
+        if self._sound_enabled:
+            play_start_sound(self._start_vol)
         if self.tray:
             self.tray.set_recording(True)
         self.recorder.start_recording()
         return True
 
     def _do_recording_stop(self, source: str) -> tuple[np.ndarray, float] | None:
-        """Stop recording with ownership guard.
+        """Stop recording with ownership guard and collect the audio.
+
+        Synchronous form of _arm_stop() followed by _collect_recording().
 
         Args:
             source: Recording source identifier ("save" or "paste").
@@ -396,29 +505,68 @@ class ElivroImagineApp:
         Returns:
             Tuple of (audio, duration) or None if no audio/wrong source.
         """
-        if not self.recorder:
+        if not self._arm_stop(source):
             return None
+        return self._collect_recording(source)
+
+    def _arm_stop(self, source: str) -> bool:
+        """Give stop feedback for a recording without collecting its audio.
+
+        Runs on the hotkey thread, so it only does the ownership check,
+        stop sound and tray update. Ownership is held until
+        _collect_recording() has stopped the recorder, so a new recording
+        cannot start on top of the one being drained.
+
+        Args:
+            source: Recording source identifier ("save" or "paste").
+
+        Returns:
+            True if the caller must now collect the recording.
+        """
+        if not self.recorder:
+            return False
 
         with self._recording_lock:
-            if self._active_recording_source != source:
+            if self._active_recording_source != source or self._recording_stopping:
                 logger.debug(
-                    f"Recording stop ignored: source '{source}' doesn't own "
-                    f"recording (owner: '{self._active_recording_source}')"
+                    "Recording stop ignored: source '%s' doesn't own "
+                    "recording (owner: '%s')",
+                    source,
+                    self._active_recording_source,
                 )
-                return None
-            self._active_recording_source = None
+                return False
+            self._recording_stopping = True
 
-        logger.info(f"Recording stopped (source: {source})")
+        logger.info("Recording stopped (source: %s)", source)
 
         # Play sound IMMEDIATELY - user feedback first
-        config = self.config  # Atomic reference read
-        if config.sound.enabled:
-            play_stop_sound(config.sound.stop_volume)
+        if self._sound_enabled:
+            play_stop_sound(self._stop_vol)
         if self.tray:
             self.tray.set_recording(False)
+        return True
+
+    def _collect_recording(self, source: str) -> tuple[np.ndarray, float] | None:
+        """Stop the recorder and return its audio, releasing ownership.
+
+        Args:
+            source: Recording source that armed the stop.
+
+        Returns:
+            Tuple of (audio, duration) or None if no usable audio.
+        """
+        try:
+            result = (
+                self.recorder.stop_recording(min_duration=MIN_RECORDING_SECONDS)
+                if self.recorder
+                else None
+            )
+        finally:
+            with self._recording_lock:
+                if self._active_recording_source == source:
+                    self._active_recording_source = None
+                self._recording_stopping = False
 
-        # Now stop recorder and process (can take time)
-        result = self.recorder.stop_recording()
         if result is None:
             logger.warning("No audio recorded")
             if self.tray:
@@ -427,7 +575,7 @@ class ElivroImagineApp:
 
         audio, duration = result
 
-        if duration < 0.5:
+        if duration < MIN_RECORDING_SECONDS:
             logger.warning("Recording too short")
             if self.tray:
                 self.tray.notify("ElivroImagine", "Recording too short (< 0.5s)")
@@ -435,18 +583,61 @@ class ElivroImagineApp:
 
         return audio, duration
 
+    def _spawn_transcription(
+        self, source: str, handler: Callable[..., None], *args: object
+    ) -> None:
+        """Collect a stopped recording and transcribe it on a daemon thread.
+
+        Args:
+            source: Recording source that armed the stop.
+            handler: Transcription method, called as handler(audio, duration, *args).
+            *args: Extra arguments passed to handler.
+        """
+        threading.Thread(
+            target=self._collect_and_dispatch,
+            args=(source, handler, *args),
+            daemon=True,
+            name="transcription",
+        ).start()
+
+    def _collect_and_dispatch(
+        self, source: str, handler: Callable[..., None], *args: object
+    ) -> None:
+        """Collect the recording, then run its transcription.
+
+        The recorder is stopped straight away; only the transcription waits
+        for one of the transcription worker slots, so a backlog of
+        transcriptions never keeps the microphone open.
+
+        Args:
+            source: Recording source that armed the stop.
+            handler: Transcription method, called as handler(audio, duration, *args).
+            *args: Extra arguments passed to handler.
+        """
+        result = self._collect_recording(source)
+        if result is None:
+            return
+        audio, duration = result
+        if _is_silent(audio):
+            logger.warning("Recording is silent, skipping transcription")
+            if self.tray:
+                self.tray.notify("ElivroImagine", "No speech detected")
+            return
+        with self._transcription_sem:
+            # Jobs still queued when the app quits are dropped, not started
+            if self._shutdown_event.is_set():
+                logger.info("Skipping queued transcription: shutting down")
+                return
+            handler(audio, duration, *args)
+
     def _on_save_recording_start(self) -> None:
         """Handle save hotkey recording start."""
         self._do_recording_start("save")
 
     def _on_save_recording_stop(self) -> None:
         """Handle save hotkey recording stop."""
-        result = self._do_recording_stop("save")
-        if result is not None:
-            audio, duration = result
-            self._transcription_pool.submit(
-                self._transcribe_and_save, audio, duration
-            )
+        if self._arm_stop("save"):
+            self._spawn_transcription("save", self._transcribe_and_save)
 
     def _on_paste_recording_start(self) -> None:
         """Handle paste hotkey recording start."""
@@ -454,12 +645,8 @@ class ElivroImagineApp:
 
     def _on_paste_recording_stop(self) -> None:
         """Handle paste hotkey recording stop."""
-        result = self._do_recording_stop("paste")
-        if result is not None:
-            audio, duration = result
-            self._transcription_pool.submit(
-                self._transcribe_and_paste, audio, duration
-            )
+        if self._arm_stop("paste"):
+            self._spawn_transcription("paste", self._transcribe_and_paste)
 
     def _on_devtracker_recording_start(self) -> None:
         """Handle devtracker hotkey recording start."""
@@ -467,16 +654,31 @@ class ElivroImagineApp:
 
     def _on_devtracker_recording_stop(self) -> None:
         """Handle devtracker hotkey recording stop."""
-        result = self._do_recording_stop("devtracker")
-        if result is not None:
-            audio, duration = result
-            project = self.config.devtracker_hotkey.project
-            self._transcription_pool.submit(
-                self._transcribe_and_create_project_task, audio, duration, project
+        if self._arm_stop("devtracker"):
+            self._spawn_transcription(
+                "devtracker",
+                self._transcribe_and_create_project_task,
+                self._devtracker_project,
             )
 
-    def _transcribe_and_save(self, audio: np.ndarray, duration: float) -> None:
-        """Transcribe audio and save to file or create DevTracker task."""
+    def _run_transcription_pipeline(
+        self,
+        audio: np.ndarray,
+        duration: float,
+        consumer: Callable[[str], None],
+        label: str = "",
+    ) -> None:
+        """Transcribe audio and hand non-empty text to a consumer.
+
+        Shared by the save, paste and devtracker hotkeys: owns the tray
+        transcribing state and reports transcription errors.
+
+        Args:
+            audio: Audio data to transcribe.
+            duration: Duration of the recording in seconds.
+            consumer: Called with the transcribed text.
+            label: Suffix for the progress log line (e.g. " for paste").
+        """
         if not self.transcriber:
             logger.error("Transcriber unavailable")
             if self.tray:
@@ -489,11 +691,9 @@ class ElivroImagineApp:
             self.tray.set_transcribing(True)
 
         try:
-            logger.info(f"Transcribing {duration:.1f}s of audio...")
+            logger.info("Transcribing %.1fs of audio%s...", duration, label)
 
-            text = self.transcriber.transcribe(
-                audio, self.config.recording.sample_rate
-            )
+            text = self.transcriber.transcribe(audio, self._sample_rate)
 
             if not text.strip():
                 logger.warning("Transcription returned empty text")
@@ -501,24 +701,7 @@ class ElivroImagineApp:
                     self.tray.notify("ElivroImagine", "No speech detected")
                 return
 
-            # DevTracker path: classify and create task
-            if self._devtracker:
-                self._create_devtracker_task(text)
-                return
-
-            # Fallback: save to file
-            if not self.storage:
-                logger.error("Storage unavailable")
-                if self.tray:
-                    self.tray.notify("ElivroImagine Error", "Storage unavailable")
-                return
-
-            filepath = self.storage.save_transcription(text, duration)
-            logger.info(f"Saved transcription to {filepath}")
-
-            preview = text[:100] + "..." if len(text) > 100 else text
-            if self.tray:
-                self.tray.notify("Transcription Saved", preview)
+            consumer(text)
 
         except TranscriptionTimeoutError:
             logger.error("Transcription timed out")
@@ -544,6 +727,40 @@ class ElivroImagineApp:
             if self.tray:
                 self.tray.set_transcribing(False)
 
+    def _transcribe_and_save(self, audio: np.ndarray, duration: float) -> None:
+        """Transcribe audio and save to file or create DevTracker task."""
+        self._run_transcription_pipeline(
+            audio,
+            duration,
+            functools.partial(self._save_text_or_devtracker, duration=duration),
+        )
+
+    def _save_text_or_devtracker(self, text: str, duration: float) -> None:
+        """Create a DevTracker task from text, or save it to a file.
+
+        Args:
+            text: Transcribed text.
+            duration: Duration of the recording in seconds.
+        """
+        # DevTracker path: classify and create task
+        if self._devtracker:
+            self._create_devtracker_task(text)
+            return
+
+        # Fallback: save to file
+        if not self.storage:
+            logger.error("Storage unavailable")
+            if self.tray:
+                self.tray.notify("ElivroImagine Error", "Storage unavailable")
+            return
+
+        filepath = self.storage.save_transcription(text, duration)
+        logger.info("Saved transcription to %s", filepath)
+
+        preview = f"{text[:97]}..." if len(text) > 100 else text
+        if self.tray:
+            self.tray.notify("Transcription Saved", preview)
+
     def _create_devtracker_task(
         self, text: str, project_override: str | None = None
     ) -> None:
@@ -569,9 +786,11 @@ class ElivroImagineApp:
                 text, api_key, categories=category_names
             )
             logger.info(
-                f"Classified: intent={classification.intent}, "
-                f"title='{classification.title}' "
-                f"[{classification.category}/{classification.priority}]"
+                "Classified: intent=%s, title='%s' [%s/%s]",
+                classification.intent,
+                classification.title,
+                classification.category,
+                classification.priority,
             )
 
             if classification.intent == "update":
@@ -614,7 +833,7 @@ class ElivroImagineApp:
         if duplicate:
             dup_id = duplicate.get("id", "?")
             dup_title = duplicate.get("title", "")
-            logger.info(f"Duplicate found: #{dup_id} {dup_title}")
+            logger.info("Duplicate found: #%s %s", dup_id, dup_title)
             if self.tray:
                 self.tray.notify(
                     "Duplicate Task",
@@ -637,7 +856,9 @@ class ElivroImagineApp:
 
         project_label = project_override or self.config.devtracker.project
         task_id = task.get("id", "?")
-        logger.info(f"Created task #{task_id} ({project_label}): {classification.title}")
+        logger.info(
+            "Created task #%s (%s): %s", task_id, project_label, classification.title
+        )
         if self.tray:
             self.tray.notify(
                 f"Task Created ({project_label})",
@@ -688,9 +909,7 @@ class ElivroImagineApp:
         project_label = project_override or self.config.devtracker.project
         task_id = classification.task_id
         fields_str = ", ".join(changed_fields)
-        logger.info(
-            f"Updated task #{task_id} ({project_label}): {fields_str}"
-        )
+        logger.info("Updated task #%s (%s): %s", task_id, project_label, fields_str)
         if self.tray:
             self.tray.notify(
                 f"Task Updated ({project_label})",
@@ -707,50 +926,12 @@ class ElivroImagineApp:
             duration: Duration of the recording in seconds.
             project: Target project name for the task.
         """
-        if not self.transcriber:
-            logger.error("Transcriber unavailable")
-            if self.tray:
-                self.tray.notify(
-                    "ElivroImagine Error", "Transcription service unavailable"
-                )
-            return
-
-        if self.tray:
-            self.tray.set_transcribing(True)
-
-        try:
-            logger.info(f"Transcribing {duration:.1f}s of audio for {project} task...")
-
-            text = self.transcriber.transcribe(
-                audio, self.config.recording.sample_rate
-            )
-
-            if not text.strip():
-                logger.warning("Transcription returned empty text")
-                if self.tray:
-                    self.tray.notify("ElivroImagine", "No speech detected")
-                return
-
-            self._create_devtracker_task(text, project_override=project)
-
-        except TranscriptionTimeoutError:
-            logger.error("Transcription timed out")
-            if self.tray:
-                self.tray.notify(
-                    "ElivroImagine Error",
-                    "Transcription timed out. Try a shorter recording.",
-                )
-
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            if self.tray:
-                self.tray.notify(
-                    "ElivroImagine Error", f"Transcription failed: {e}"
-                )
-
-        finally:
-            if self.tray:
-                self.tray.set_transcribing(False)
+        self._run_transcription_pipeline(
+            audio,
+            duration,
+            functools.partial(self._create_devtracker_task, project_override=project),
+            label=f" for {project} task",
+        )
 
     def _transcribe_and_paste(self, audio: np.ndarray, duration: float) -> None:
         """Transcribe audio and paste into focused field."""
@@ -760,67 +941,78 @@ class ElivroImagineApp:
                 self.tray.notify("ElivroImagine", "Paste unavailable")
             return
 
-        if self.tray:
-            self.tray.set_transcribing(True)
-
-        try:
-            logger.info(f"Transcribing {duration:.1f}s of audio for paste...")
-
-            text = self.transcriber.transcribe(
-                audio, self.config.recording.sample_rate
-            )
-
-            if not text.strip():
-                logger.warning("Transcription returned empty text")
-                if self.tray:
-                    self.tray.notify("ElivroImagine", "No speech detected")
-                return
-
-            success = self.paster.paste_text(text)
-            if success:
-                preview = text[:100] + "..." if len(text) > 100 else text
-                logger.info(f"Pasted transcription: {preview}")
-            else:
-                logger.error("Failed to paste text")
-                if self.tray:
-                    self.tray.notify("ElivroImagine", "Failed to paste text")
+        self._run_transcription_pipeline(
+            audio, duration, self._paste_text, label=" for paste"
+        )
 
-        except TranscriptionTimeoutError:
-            logger.error("Transcription timed out")
-            if self.tray:
-                self.tray.notify("ElivroImagine", "Transcription timed out")
+    def _paste_text(self, text: str) -> None:
+        """Paste transcribed text into the focused field.
 
-        except Exception as e:
-            logger.error(f"Transcribe-and-paste failed: {e}")
-            if self.tray:
-                self.tray.notify("ElivroImagine", f"Paste failed: {e}")
+        Args:
+            text: Transcribed text.
+        """
+        if not self.paster:
+            return
 
-        finally:
+        if self.paster.paste_text(text):
+            preview = f"{text[:97]}..." if len(text) > 100 else text
+            logger.info("Pasted transcription: %s", preview)
+        else:
+            logger.error("Failed to paste text")
             if self.tray:
-                self.tray.set_transcribing(False)
+                self.tray.notify("ElivroImagine", "Failed to paste text")
 
     def _on_recorder_status(self, status: str) -> None:
         """Handle recorder status changes."""
-        logger.debug(f"Recorder status: {status}")
+        logger.debug("Recorder status: %s", status)
         if status.startswith("error:") or status.startswith("warning:"):
             if self.tray:
                 self.tray.notify("ElivroImagine", status)
 
     def _show_settings(self) -> None:
         """Show settings window."""
-        if self._settings_thread and self._settings_thread.is_alive():
-            return
+        with self._settings_lock:
+            if self._settings_open:
+                return
+            self._settings_open = True
+            if self._settings_thread is None:
+                self._settings_thread = threading.Thread(
+                    target=self._settings_loop, daemon=True, name="settings"
+                )
+                self._settings_thread.start()
+        self._settings_wake.set()
 
-        def run_settings() -> None:
-            settings = SettingsWindow(
-                self.config,
-                self._on_settings_saved,
-                on_capture_state_changed=self._on_hotkey_capture_state_changed,
-            )
-            settings.show()
+    def _settings_loop(self) -> None:
+        """Open a settings window each time _show_settings() wakes this thread.
 
-        self._settings_thread = threading.Thread(target=run_settings, daemon=True)
-        self._settings_thread.start()
+        Every window (and its Tk root) is created and destroyed on this one
+        thread, so reopening settings doesn't spawn a new thread.
+        """
+        while True:
+            self._settings_wake.wait()
+            self._settings_wake.clear()
+            if self._shutdown_event.is_set():
+                return
+            try:
+                # The window edits its own copy, so a save can be diffed
+                # against the config currently applied
+                settings = SettingsWindow(
+                    copy.deepcopy(self.config),
+                    self._on_settings_saved,
+                    on_capture_state_changed=self._on_hotkey_capture_state_changed,
+                )
+                with self._settings_lock:
+                    self._settings_window = settings
+                # _quit() may have run before the window was registered
+                if self._shutdown_event.is_set():
+                    return
+                settings.show()
+            except Exception as e:
+                logger.error(f"Settings window failed: {e}")
+            finally:
+                with self._settings_lock:
+                    self._settings_window = None
+                    self._settings_open = False
 
     def _on_hotkey_capture_state_changed(self, capturing: bool) -> None:
         """Handle hotkey capture state changes from settings window.
@@ -829,14 +1021,92 @@ class ElivroImagineApp:
             capturing: True if capture started, False if capture ended.
         """
         self._hotkey_capture_active = capturing
-        logger.debug(f"Hotkey capture active: {capturing}")
+        logger.debug("Hotkey capture active: %s", capturing)
 
     def _on_settings_saved(self, config: Config) -> None:
         """Handle settings saved."""
         logger.info("Settings saved, updating components")
+        old = self.config
         self.config = config
+        self._refresh_cached_config()
+
+        def changed(*sections: str) -> bool:
+            # Only push sections that differ from the config applied before
+            return old is config or any(
+                getattr(old, section) != getattr(config, section)
+                for section in sections
+            )
+
+        if changed("hotkey", "paste_hotkey", "devtracker_hotkey", "devtracker"):
+            # Re-register each hotkey at most once, however many fields changed
+            listeners = [
+                listener
+                for listener in (self.hotkey, self.paste_hotkey, self.devtracker_hotkey)
+                if listener
+            ]
+            for listener in listeners:
+                listener.begin_batch()
+            try:
+                self._apply_hotkey_settings(config)
+            finally:
+                for listener in listeners:
+                    listener.end_batch()
+
+        if changed("recording") and self.recorder:
+            self.recorder.update_config(config.recording)
+
+        if self.transcriber:
+            if changed("whisper"):
+                self.transcriber.update_config(config.whisper)
+            if changed("transcription"):
+                self.transcriber.update_transcription_config(config.transcription)
+
+        # Update DevTracker client
+        if changed("devtracker"):
+            if config.devtracker.enabled:
+                if self._devtracker:
+                    self._devtracker.update_config(config.devtracker)
+                else:
+                    self._devtracker = DevTrackerClient(config.devtracker)
+            else:
+                self._devtracker = None
+
+        if changed("storage"):
+            if self.storage:
+                self.storage.update_config(config.storage)
+            transcriptions_folder = config.storage.transcriptions_path
+            if transcriptions_folder != self._transcriptions_folder:
+                self._transcriptions_folder = transcriptions_folder
+                if self.tray:
+                    self.tray.update_transcriptions_folder(transcriptions_folder)
+
+        # Update Windows autostart setting (first save applies unconditionally)
+        autostart = config.startup.start_with_windows
+        if sys.platform == "win32" and autostart != self._last_autostart_value:
+            if self._startup_manager is None:
+                from .windows import WindowsStartupManager
+
+                self._startup_manager = WindowsStartupManager()
+            if autostart:
+                self._startup_manager.enable_autostart()
+            else:
+                self._startup_manager.disable_autostart()
+            self._last_autostart_value = autostart
+
+        logger.info(
+            "Updated settings. Hotkey: %s (mode: %s), Language: %s",
+            config.hotkey.combination,
+            config.hotkey.mode,
+            config.whisper.language,
+        )
 
-        # Update components with new config
+    def _apply_hotkey_settings(self, config: Config) -> None:
+        """Update, create or stop hotkey listeners for new settings.
+
+        Args:
+            config: Newly saved configuration.
+        """
+        # Update main hotkey
         if self.hotkey:
             self.hotkey.update_combination(
                 config.hotkey.combination, config.hotkey.scan_code
@@ -872,19 +1142,6 @@ class ElivroImagineApp:
                 self.paste_hotkey = None
                 self.paster = None
 
-        if self.transcriber:
-            self.transcriber.update_config(config.whisper)
-            self.transcriber.update_transcription_config(config.transcription)
-
-        # Update DevTracker client
-        if config.devtracker.enabled:
-            if self._devtracker:
-                self._devtracker.update_config(config.devtracker)
-            else:
-                self._devtracker = DevTrackerClient(config.devtracker)
-        else:
-            self._devtracker = None
-
         # Update devtracker hotkey (requires both devtracker and devtracker_hotkey enabled)
         if config.devtracker_hotkey.enabled and config.devtracker.enabled:
             if self.devtracker_hotkey is None:
@@ -907,39 +1164,16 @@ class ElivroImagineApp:
                 self.devtracker_hotkey.stop()
                 self.devtracker_hotkey = None
 
-        if self.storage:
-            self.storage.update_config(config.storage)
-        if self.tray:
-            self.tray.update_transcriptions_folder(config.storage.transcriptions_path)
-
-        # Update Windows autostart setting
-        if sys.platform == "win32":
-            from .windows import WindowsStartupManager
-
-            manager = WindowsStartupManager()
-            if config.startup.start_with_windows:
-                manager.enable_autostart()
-            else:
-                manager.disable_autostart()
-
-        logger.info(
-            f"Updated settings. Hotkey: {config.hotkey.combination} "
-            f"(mode: {config.hotkey.mode}), "
-            f"Language: {config.whisper.language}"
-        )
-
     def _quit(self) -> None:
         """Quit the application."""
         logger.info("Shutting down ElivroImagine")
         self._running = False
+        self._shutdown_event.set()
 
         # Stop recording if in progress
         if self.recorder and self.recorder.is_recording:
             self.recorder.stop_recording()
 
-        # Shutdown transcription pool (cancel pending, don't block on active)
-        self._transcription_pool.shutdown(wait=False, cancel_futures=True)
-
         # Stop components
         if self.hotkey:
             self.hotkey.stop()
@@ -955,11 +1189,18 @@ class ElivroImagineApp:
 
         cleanup_mixer()
 
-        # Wait for settings thread
+        # Close an open settings window and release the settings worker; the
+        # join is only a safety net, the thread is a daemon anyway
+        with self._settings_lock:
+            settings_window = self._settings_window
+        if settings_window is not None:
+            settings_window.request_close()
+        self._settings_wake.set()
         if self._settings_thread and self._settings_thread.is_alive():
-            self._settings_thread.join(timeout=1.0)
+            self._settings_thread.join(timeout=0.1)
 
         # Release instance lock
         self._instance_lock.release()
 
         logger.info("ElivroImagine shutdown complete")
+        self._stop_log_listener()
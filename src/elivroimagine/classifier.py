@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads  # Optional speedup; errors subclass JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 API_URL = "https://api.berget.ai/v1/chat/completions"
 MODEL = "mistralai/Mistral-Small-3.2-24B-Instruct-2506"
 
-VALID_PRIORITIES = ["low", "medium", "high", "critical"]
-VALID_EFFORTS = ["tiny", "small", "medium", "large", "massive"]
+# Opening markdown fence, e.g. ```json
+_OPEN_FENCE_RE = re.compile(r"^```\w*\s*")
+
+# Shared keep-alive session: classifications reuse one TLS connection
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+VALID_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
+VALID_EFFORTS = frozenset({"tiny", "small", "medium", "large", "massive"})
 
 SYSTEM_PROMPT_TEMPLATE = """\
 You are a task classifier for a software development project.
@@ -84,16 +102,28 @@ class TaskClassification:
     task_id: int | None = None  # Only set for "update" intent
 
 
-def _fuzzy_match_category(name: str, valid_categories: list[str]) -> str:
+@functools.lru_cache(maxsize=32)
+def _lowered_categories(categories: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Pair each category with its lowercase form, once per category list."""
+    return tuple((cat.lower(), cat) for cat in categories)
+
+
+def _fuzzy_match_category(
+    name: str, lowered_categories: tuple[tuple[str, str], ...]
+) -> str:
     """Try to match an unknown category name to a valid one.
 
+    Args:
+        name: Category name returned by the model.
+        lowered_categories: (lowercase, original) pairs from _lowered_categories().
+
     Falls back to the first category if no match found.
     """
     name_lower = name.lower()
-    for cat in valid_categories:
-        if cat.lower() in name_lower or name_lower in cat.lower():
+    for cat_lower, cat in lowered_categories:
+        if cat_lower in name_lower or name_lower in cat_lower:
             return cat
-    return valid_categories[0] if valid_categories else name
+    return lowered_categories[0][1] if lowered_categories else name
 
 
 def _strip_markdown_fences(text: str) -> str:
@@ -101,14 +131,32 @@ def _strip_markdown_fences(text: str) -> str:
     text = text.strip()
     if text.startswith("```"):
         # Remove opening fence (```json or ```)
-        text = re.sub(r"^```\w*\s*", "", text)
+        text = _OPEN_FENCE_RE.sub("", text)
     if text.endswith("```"):
         text = text[:-3]
     return text.strip()
 
 
-def _build_system_prompt(categories: list[str]) -> str:
-    """Build the system prompt with the given category list."""
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Concurrent classifications (one per transcription worker)
+                session.mount("https://", HTTPAdapter(pool_maxsize=4))
+                atexit.register(session.close)
+                _session = session
+    return _session
+
+
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt(categories: tuple[str, ...]) -> str:
+    """Build the system prompt with the given category list.
+
+    Cached: a project's category list rarely changes between calls.
+    """
     category_lines = "\n".join(f"- {cat}" for cat in categories)
     return SYSTEM_PROMPT_TEMPLATE.format(categories=category_lines)
 
@@ -130,10 +178,12 @@ def classify_transcription(
     Raises:
         ClassificationError: If the API call or parsing fails.
     """
-    system_prompt = _build_system_prompt(categories or ["General"])
+    category_tuple = tuple(categories) if categories else ("General",)
+    category_set = frozenset(category_tuple)
+    system_prompt = _build_system_prompt(category_tuple)
 
     try:
-        resp = requests.post(
+        resp = _get_session().post(
             API_URL,
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -153,10 +203,11 @@ def classify_transcription(
         raise ClassificationError(f"API request failed: {e}") from e
 
     if resp.status_code != 200:
-        raise ClassificationError(f"API error {resp.status_code}: {resp.text[:200]}")
+        snippet = resp.content[:200].decode("utf-8", "replace")
+        raise ClassificationError(f"API error {resp.status_code}: {snippet}")
 
     try:
-        api_result = resp.json()
+        api_result = _json_loads(resp.content)
         content = api_result["choices"][0]["message"]["content"]
     except (KeyError, IndexError, ValueError) as e:
         raise ClassificationError(f"Unexpected API response format: {e}") from e
@@ -164,7 +215,7 @@ def classify_transcription(
     content = _strip_markdown_fences(content)
 
     try:
-        parsed = json.loads(content)
+        parsed = _json_loads(content)
     except json.JSONDecodeError as e:
         raise ClassificationError(
             f"Failed to parse classification JSON: {e}. Raw: {content[:200]}"
@@ -195,8 +246,10 @@ def classify_transcription(
         effort = str(parsed["effort"]).lower() if "effort" in parsed else None
 
         # Validate non-None fields
-        if categories and category is not None and category not in categories:
-            category = _fuzzy_match_category(category, categories)
+        if categories and category is not None and category not in category_set:
+            category = _fuzzy_match_category(
+                category, _lowered_categories(category_tuple)
+            )
         if priority is not None and priority not in VALID_PRIORITIES:
             priority = "medium"
         if effort is not None and effort not in VALID_EFFORTS:
@@ -220,8 +273,10 @@ def classify_transcription(
     effort = str(parsed.get("effort", "medium")).lower()
 
     # Validate and fix category against the provided list
-    if categories and category not in categories:
-        category = _fuzzy_match_category(category, categories)
+    if categories and category not in category_set:
+        category = _fuzzy_match_category(
+            category, _lowered_categories(category_tuple)
+        )
 
     # Validate priority and effort
     if priority not in VALID_PRIORITIES:
@@ -1,11 +1,171 @@
 """Clipboard paste functionality via Win32 API."""
 
+import ctypes
+import functools
 import logging
+import random
 import sys
 import time
+from ctypes import wintypes
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+
+# Win32 error from OpenClipboard while another window holds the clipboard;
+# the only failure worth retrying
+ERROR_ACCESS_DENIED = 5
+
+# Clipboard retry backoff: doubles from about one scheduler tick, with jitter
+# so competing retriers don't keep colliding
+_RETRY_BASE_DELAY = 0.015
+_RETRY_MAX_DELAY = 0.25
+_RETRY_JITTER = 0.01
+_RETRY_BUDGET = 0.5  # Total seconds spent waiting across retries
+
+# Virtual key codes
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+# Input types and flags
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+
+# Structure definitions for SendInput
+ULONG_PTR = ctypes.POINTER(ctypes.c_ulong)
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class INPUT_UNION(ctypes.Union):
+    _fields_ = [
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("union", INPUT_UNION),
+    ]
+
+
+def _build_ctrl_v_inputs() -> ctypes.Array:
+    """Build the SendInput events for Ctrl+V: Ctrl down, V down, V up, Ctrl up."""
+    inputs = (INPUT * 4)()
+    keys = [
+        (VK_CONTROL, 0),
+        (VK_V, 0),
+        (VK_V, KEYEVENTF_KEYUP),
+        (VK_CONTROL, KEYEVENTF_KEYUP),
+    ]
+    for event, (vk, flags) in zip(inputs, keys):
+        event.type = INPUT_KEYBOARD
+        event.union.ki.wVk = vk
+        event.union.ki.dwFlags = flags
+    return inputs
+
+
+# SendInput only reads the array, so one copy can serve every paste
+_CTRL_V_INPUTS = _build_ctrl_v_inputs()
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
+@functools.lru_cache(maxsize=1)
+def _pynput_keyboard() -> tuple[Any, Any]:
+    """Get a pynput keyboard Controller and the Key enum, created on first use.
+
+    pynput is only needed when SendInput fails, so it isn't imported up front.
+    """
+    from pynput.keyboard import Controller, Key
+
+    return Controller(), Key
+
+
+def _win32_function(dll: Any, name: str, restype: Any, *argtypes: Any) -> Any:
+    """Look up a Win32 function and declare its signature once.
+
+    Returns None off Windows, where the DLL isn't available.
+    """
+    if dll is None:
+        return None
+    func = getattr(dll, name)
+    func.argtypes = list(argtypes)
+    func.restype = restype
+    return func
+
+
+# Win32 functions are resolved and prototyped once, at import
+if sys.platform == "win32":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+else:
+    _user32 = _kernel32 = None
+
+_OpenClipboard = _win32_function(_user32, "OpenClipboard", wintypes.BOOL, wintypes.HWND)
+_CloseClipboard = _win32_function(_user32, "CloseClipboard", wintypes.BOOL)
+_EmptyClipboard = _win32_function(_user32, "EmptyClipboard", wintypes.BOOL)
+_IsClipboardFormatAvailable = _win32_function(
+    _user32, "IsClipboardFormatAvailable", wintypes.BOOL, wintypes.UINT
+)
+_GetClipboardData = _win32_function(
+    _user32, "GetClipboardData", wintypes.HANDLE, wintypes.UINT
+)
+_SetClipboardData = _win32_function(
+    _user32, "SetClipboardData", wintypes.HANDLE, wintypes.UINT, wintypes.HANDLE
+)
+_SendInput = _win32_function(
+    _user32,
+    "SendInput",
+    wintypes.UINT,
+    wintypes.UINT,
+    ctypes.POINTER(INPUT),
+    ctypes.c_int,
+)
+_GlobalAlloc = _win32_function(
+    _kernel32, "GlobalAlloc", wintypes.HGLOBAL, wintypes.UINT, ctypes.c_size_t
+)
+_GlobalLock = _win32_function(
+    _kernel32, "GlobalLock", ctypes.c_void_p, wintypes.HGLOBAL
+)
+_GlobalUnlock = _win32_function(
+    _kernel32, "GlobalUnlock", wintypes.BOOL, wintypes.HGLOBAL
+)
+_GlobalFree = _win32_function(
+    _kernel32, "GlobalFree", wintypes.HGLOBAL, wintypes.HGLOBAL
+)
+
 
 class Paster:
     """Pastes text into the currently focused field via clipboard + Ctrl+V."""
@@ -18,6 +178,8 @@ class Paster:
                                Default is False - the transcription stays in clipboard.
         """
         self.restore_clipboard = restore_clipboard
+        # Win32 error code of the last failed _set_clipboard(), None if unknown
+        self._last_set_error: int | None = None
 
         if sys.platform != "win32":
             logger.warning("Paster only works on Windows")
@@ -54,11 +216,13 @@ class Paster:
                 logger.error("Failed to set clipboard text after retries")
                 return False
 
-            # Verify clipboard was set correctly
-            verify = self._get_clipboard()
-            if verify != text:
-                logger.error(f"Clipboard verification failed: expected {len(text)} chars, got {len(verify) if verify else 0}")
-                return False
+            # SetClipboardData succeeded, so the text is on the clipboard;
+            # read it back only when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                verify = self._get_clipboard()
+                if verify != text:
+                    logger.error(f"Clipboard verification failed: expected {len(text)} chars, got {len(verify) if verify else 0}")
+                    return False
 
             logger.info(f"Clipboard set successfully: {len(text)} chars")
 
@@ -68,8 +232,10 @@ class Paster:
             # Simulate Ctrl+V using SendInput
             self._simulate_ctrl_v()
 
-            # Delay to let the paste complete before any restore
-            time.sleep(0.2)
+            # Delay to let the paste complete before a restore; without one
+            # the text stays on the clipboard and nothing needs waiting for
+            if self.restore_clipboard:
+                time.sleep(0.2)
 
             return True
 
@@ -90,41 +256,27 @@ class Paster:
             Clipboard text, or None if clipboard doesn't contain text.
         """
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            CF_UNICODETEXT = 13
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
-
-            user32.OpenClipboard.argtypes = [wintypes.HWND]
-            user32.OpenClipboard.restype = wintypes.BOOL
-            user32.CloseClipboard.argtypes = []
-            user32.CloseClipboard.restype = wintypes.BOOL
-            user32.GetClipboardData.argtypes = [wintypes.UINT]
-            user32.GetClipboardData.restype = wintypes.HANDLE
-
-            if not user32.OpenClipboard(None):
+            if not _OpenClipboard(None):
                 return None
 
             try:
-                if not user32.IsClipboardFormatAvailable(CF_UNICODETEXT):
+                if not _IsClipboardFormatAvailable(CF_UNICODETEXT):
                     return None
 
-                handle = user32.GetClipboardData(CF_UNICODETEXT)
+                handle = _GetClipboardData(CF_UNICODETEXT)
                 if not handle:
                     return None
 
-                ptr = kernel32.GlobalLock(handle)
+                ptr = _GlobalLock(handle)
                 if not ptr:
                     return None
 
                 try:
                     return ctypes.wstring_at(ptr)
                 finally:
-                    kernel32.GlobalUnlock(handle)
+                    _GlobalUnlock(handle)
             finally:
-                user32.CloseClipboard()
+                _CloseClipboard()
 
         except Exception as e:
             logger.debug(f"Failed to get clipboard: {e}")
@@ -139,85 +291,61 @@ class Paster:
         Returns:
             True if successful.
         """
+        self._last_set_error = None
         try:
-            import ctypes
-            from ctypes import wintypes, c_size_t, c_void_p, c_wchar_p
+            # Encode text as wide string (UTF-16 LE); the null terminator is
+            # written into the buffer directly rather than appended to text
+            data = text.encode("utf-16-le")
+            buf_size = len(data) + 2  # 2 bytes for the UTF-16 null
 
-            CF_UNICODETEXT = 13
-            GMEM_MOVEABLE = 0x0002
-
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
-
-            # Properly declare all function signatures
-            kernel32.GlobalAlloc.argtypes = [wintypes.UINT, c_size_t]
-            kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
-
-            kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
-            kernel32.GlobalLock.restype = c_void_p
-
-            kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
-            kernel32.GlobalUnlock.restype = wintypes.BOOL
-
-            kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
-            kernel32.GlobalFree.restype = wintypes.HGLOBAL
-
-            user32.OpenClipboard.argtypes = [wintypes.HWND]
-            user32.OpenClipboard.restype = wintypes.BOOL
-            user32.CloseClipboard.argtypes = []
-            user32.CloseClipboard.restype = wintypes.BOOL
-            user32.EmptyClipboard.argtypes = []
-            user32.EmptyClipboard.restype = wintypes.BOOL
-            user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
-            user32.SetClipboardData.restype = wintypes.HANDLE
-
-            # Encode text as wide string (UTF-16 LE with null terminator)
-            text_with_null = text + "\0"
-            buf_size = len(text_with_null) * 2  # 2 bytes per UTF-16 char
-
-            h_mem = kernel32.GlobalAlloc(GMEM_MOVEABLE, buf_size)
+            h_mem = _GlobalAlloc(GMEM_MOVEABLE, buf_size)
             if not h_mem:
+                self._last_set_error = ctypes.get_last_error()
                 logger.error(f"GlobalAlloc failed for {buf_size} bytes")
                 return False
 
-            ptr = kernel32.GlobalLock(h_mem)
+            ptr = _GlobalLock(h_mem)
             if not ptr:
-                err = ctypes.get_last_error()
-                kernel32.GlobalFree(h_mem)
+                err = self._last_set_error = ctypes.get_last_error()
+                _GlobalFree(h_mem)
                 logger.error(f"GlobalLock failed, error code: {err}")
                 return False
 
             try:
                 # Copy the text using ctypes
-                ctypes.memmove(ptr, text_with_null.encode("utf-16-le"), buf_size)
+                ctypes.memmove(ptr, data, len(data))
+                ctypes.memset(ptr + len(data), 0, 2)
             finally:
-                kernel32.GlobalUnlock(h_mem)
+                _GlobalUnlock(h_mem)
 
-            if not user32.OpenClipboard(None):
-                err = ctypes.get_last_error()
-                kernel32.GlobalFree(h_mem)
+            if not _OpenClipboard(None):
+                err = self._last_set_error = ctypes.get_last_error()
+                _GlobalFree(h_mem)
                 logger.error(f"OpenClipboard failed, error code: {err}")
                 return False
 
             try:
-                user32.EmptyClipboard()
-                result = user32.SetClipboardData(CF_UNICODETEXT, h_mem)
+                _EmptyClipboard()
+                result = _SetClipboardData(CF_UNICODETEXT, h_mem)
                 if not result:
-                    err = ctypes.get_last_error()
+                    err = self._last_set_error = ctypes.get_last_error()
                     logger.error(f"SetClipboardData failed, error code: {err}")
                     return False
                 # Don't free h_mem - clipboard owns it now
                 return True
             finally:
-                user32.CloseClipboard()
+                _CloseClipboard()
 
         except Exception as e:
             logger.error(f"Failed to set clipboard: {e}", exc_info=True)
             return False
 
-    def _set_clipboard_with_retry(self, text: str, max_retries: int = 3) -> bool:
+    def _set_clipboard_with_retry(self, text: str, max_retries: int = 6) -> bool:
         """Set clipboard with retries in case another app has it locked.
 
+        Backs off exponentially with jitter within a total wait budget, and
+        stops early on errors that retrying won't fix.
+
         Args:
             text: Text to set.
             max_retries: Maximum number of attempts.
@@ -225,97 +353,31 @@ class Paster:
         Returns:
             True if successful.
         """
+        waited = 0.0
         for attempt in range(max_retries):
             if self._set_clipboard(text):
                 return True
+            err = self._last_set_error
+            if err is not None and err != ERROR_ACCESS_DENIED:
+                logger.error(f"Clipboard set failed with error {err}, not retrying")
+                return False
+            if attempt == max_retries - 1:
+                break
+            delay = min(
+                _RETRY_BASE_DELAY * 2**attempt + random.uniform(0, _RETRY_JITTER),
+                _RETRY_MAX_DELAY,
+            )
+            if waited + delay > _RETRY_BUDGET:
+                break
             logger.warning(f"Clipboard set attempt {attempt + 1} failed, retrying...")
-            time.sleep(0.1 * (attempt + 1))  # Increasing backoff
+            time.sleep(delay)
+            waited += delay
         return False
 
     def _simulate_ctrl_v(self) -> None:
         """Simulate Ctrl+V keystroke using SendInput API."""
-        import ctypes
-        from ctypes import wintypes, sizeof, POINTER, c_ulong, Structure, Union
-
-        # Virtual key codes
-        VK_CONTROL = 0x11
-        VK_V = 0x56
-
-        # Input types and flags
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_KEYUP = 0x0002
-
-        # Proper structure definitions for SendInput
-        ULONG_PTR = ctypes.POINTER(ctypes.c_ulong)
-
-        class KEYBDINPUT(Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
-
-        class MOUSEINPUT(Structure):
-            _fields_ = [
-                ("dx", wintypes.LONG),
-                ("dy", wintypes.LONG),
-                ("mouseData", wintypes.DWORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
-
-        class HARDWAREINPUT(Structure):
-            _fields_ = [
-                ("uMsg", wintypes.DWORD),
-                ("wParamL", wintypes.WORD),
-                ("wParamH", wintypes.WORD),
-            ]
-
-        class INPUT_UNION(Union):
-            _fields_ = [
-                ("mi", MOUSEINPUT),
-                ("ki", KEYBDINPUT),
-                ("hi", HARDWAREINPUT),
-            ]
-
-        class INPUT(Structure):
-            _fields_ = [
-                ("type", wintypes.DWORD),
-                ("union", INPUT_UNION),
-            ]
-
-        user32 = ctypes.windll.user32
-        user32.SendInput.argtypes = [wintypes.UINT, POINTER(INPUT), ctypes.c_int]
-        user32.SendInput.restype = wintypes.UINT
-
-        # Create input events: Ctrl down, V down, V up, Ctrl up
-        inputs = (INPUT * 4)()
-
-        # Ctrl down
-        inputs[0].type = INPUT_KEYBOARD
-        inputs[0].union.ki.wVk = VK_CONTROL
-        inputs[0].union.ki.dwFlags = 0
-
-        # V down
-        inputs[1].type = INPUT_KEYBOARD
-        inputs[1].union.ki.wVk = VK_V
-        inputs[1].union.ki.dwFlags = 0
-
-        # V up
-        inputs[2].type = INPUT_KEYBOARD
-        inputs[2].union.ki.wVk = VK_V
-        inputs[2].union.ki.dwFlags = KEYEVENTF_KEYUP
-
-        # Ctrl up
-        inputs[3].type = INPUT_KEYBOARD
-        inputs[3].union.ki.wVk = VK_CONTROL
-        inputs[3].union.ki.dwFlags = KEYEVENTF_KEYUP
-
         # Send all inputs at once
-        sent = user32.SendInput(4, inputs, sizeof(INPUT))
+        sent = _SendInput(4, _CTRL_V_INPUTS, _INPUT_SIZE)
         if sent != 4:
             err = ctypes.get_last_error()
             logger.warning(f"SendInput only sent {sent}/4 events, error: {err}")
@@ -328,9 +390,7 @@ class Paster:
     def _pynput_paste(self) -> None:
         """Fallback: Simulate Ctrl+V using pynput."""
         try:
-            from pynput.keyboard import Controller, Key
-
-            kb = Controller()
+            kb, Key = _pynput_keyboard()
             kb.press(Key.ctrl)
             kb.press('v')
             kb.release('v')
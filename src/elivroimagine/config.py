@@ -1,6 +1,7 @@
 """Configuration management for ElivroImagine."""
 
 import logging
+import os
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -8,8 +9,41 @@ from typing import Literal
 
 import yaml
 
+try:
+    # libyaml-backed parser/emitter when PyYAML was built with it
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Parsed config files by path, with the (mtime_ns, size) they were read at.
+# Loading an unchanged file reuses the data instead of parsing it again;
+# save() writes through so its own file is never re-parsed.
+_parsed_configs: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Get the (mtime_ns, size) used to tell whether a file changed."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_config_data(path: Path) -> dict:
+    """Read and parse a config file, reusing the last parse if unchanged."""
+    signature = _file_signature(path)
+    cached = _parsed_configs.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+    _parsed_configs[path] = (signature, data)
+    return data
+
+
 # Supported transcription languages: (code, display_name)
 # "auto" enables automatic language detection
 SUPPORTED_LANGUAGES: list[tuple[str, str]] = [
@@ -17,6 +51,7 @@ SUPPORTED_LANGUAGES: list[tuple[str, str]] = [
     ("en", "English"),
     ("sv", "Swedish"),
 ]
+_VALID_LANGUAGE_CODES = frozenset(code for code, _ in SUPPORTED_LANGUAGES)
 
 
 @dataclass
@@ -57,8 +92,7 @@ class WhisperConfig:
 
     def __post_init__(self) -> None:
         """Validate whisper configuration."""
-        valid_langs = [code for code, _ in SUPPORTED_LANGUAGES]
-        if self.language not in valid_langs:
+        if self.language not in _VALID_LANGUAGE_CODES:
             self.language = "auto"
         if self.transcription_timeout_seconds < 10:
             self.transcription_timeout_seconds = 10
@@ -71,16 +105,34 @@ class StorageConfig:
     """Storage configuration."""
 
     transcriptions_dir: str = "~/.elivroimagine/transcriptions"
+    # (transcriptions_dir, transcriptions_path, archive_path) last resolved;
+    # keyed on the dir because settings edit it in place
+    _paths: tuple[str, Path, Path] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _resolved_paths(self) -> tuple[str, Path, Path]:
+        """Resolve the storage paths, once per transcriptions_dir value."""
+        paths = self._paths
+        if paths is None or paths[0] != self.transcriptions_dir:
+            transcriptions_path = Path(self.transcriptions_dir).expanduser()
+            paths = (
+                self.transcriptions_dir,
+                transcriptions_path,
+                transcriptions_path / "archive",
+            )
+            self._paths = paths
+        return paths
 
     @property
     def transcriptions_path(self) -> Path:
         """Get resolved transcriptions directory path."""
-        return Path(self.transcriptions_dir).expanduser()
+        return self._resolved_paths()[1]
 
     @property
     def archive_path(self) -> Path:
         """Get archive directory path."""
-        return self.transcriptions_path / "archive"
+        return self._resolved_paths()[2]
 
 
 @dataclass
@@ -100,6 +152,13 @@ class TranscriptionConfig:
 
     backend: Literal["local", "berget"] = "local"
     berget_api_key: str = ""
+    # Concurrent transcriptions. Each extra local worker keeps its own
+    # inference buffers in RAM/VRAM, so raise this only with headroom.
+    max_workers: int = 1
+
+    def __post_init__(self) -> None:
+        """Clamp worker count to a sane range."""
+        self.max_workers = max(1, min(4, self.max_workers))
 
 
 @dataclass
@@ -181,8 +240,7 @@ class Config:
             return config
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = _read_config_data(config_path)
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse config: {e}. Using defaults.")
             # Backup corrupted config
@@ -244,6 +302,7 @@ class Config:
             "transcription": {
                 "backend": self.transcription.backend,
                 "berget_api_key": self.transcription.berget_api_key,
+                "max_workers": self.transcription.max_workers,
             },
             "storage": {
                 "transcriptions_dir": self.storage.transcriptions_dir,
@@ -272,8 +331,18 @@ class Config:
             },
         }
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Write a temp file in one go and swap it in, so a crash mid-save
+        # can't leave a truncated config behind
+        text = yaml.dump(
+            data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
+        tmp_path = config_path.with_suffix(".yaml.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+        _parsed_configs[config_path] = (_file_signature(config_path), data)
 
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
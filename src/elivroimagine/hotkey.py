@@ -50,6 +50,8 @@ class HotkeyListener:
         self._start_debounce: float = 0.15  # 150ms - prevents double-start
         self._mouse_button: mouse.Button | None = None
         self._registered_hooks: list[Callable[..., None]] = []
+        self._batch = False  # Defer re-registration until end_batch()
+        self._batch_dirty = False
 
     def _is_mouse_hotkey(self) -> bool:
         """Check if the combination uses a mouse button."""
@@ -273,26 +275,53 @@ class HotkeyListener:
                     logger.debug("Hold: starting recording")
                     self.on_start()
 
+    def _is_running(self) -> bool:
+        """Check if any keyboard or mouse hooks are registered."""
+        return (
+            self._hotkey_id is not None
+            or self._mouse_listener is not None
+            or bool(self._registered_hooks)
+        )
+
+    def _apply_change(self) -> None:
+        """Re-register hooks after a setting change (deferred inside a batch)."""
+        if self._batch:
+            self._batch_dirty = True
+            return
+        if self._is_running():
+            self.stop()
+            self.start()
+
+    def begin_batch(self) -> None:
+        """Defer hook re-registration until end_batch().
+
+        Lets several settings change with a single listener restart.
+        """
+        self._batch = True
+
+    def end_batch(self) -> None:
+        """Apply changes made since begin_batch() with one restart."""
+        self._batch = False
+        if self._batch_dirty:
+            self._batch_dirty = False
+            self._apply_change()
+
     def update_combination(
         self, combination: str, scan_code: int | None = None
     ) -> None:
         """Update the hotkey combination."""
-        was_running = self._hotkey_id is not None or self._mouse_listener is not None
-        if was_running:
-            self.stop()
+        if combination == self.combination and scan_code == self.scan_code:
+            return
         self.combination = combination
         self.scan_code = scan_code
-        if was_running:
-            self.start()
+        self._apply_change()
 
     def update_mode(self, mode: Literal["hold", "toggle"]) -> None:
         """Update the recording mode."""
-        was_running = self._hotkey_id is not None or self._mouse_listener is not None
-        if was_running:
-            self.stop()
+        if mode == self.mode:
+            return
         self.mode = mode
-        if was_running:
-            self.start()
+        self._apply_change()
 
     @property
     def is_active(self) -> bool:
@@ -25,6 +25,10 @@ class AudioRecorder:
         self._on_status_change: Callable[[str], None] | None = None
         self._lock = threading.Lock()
 
+    def update_config(self, config: RecordingConfig) -> None:
+        """Update configuration (applies from the next recording)."""
+        self.config = config
+
     def set_status_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback for status changes."""
         self._on_status_change = callback
@@ -47,9 +51,15 @@ class AudioRecorder:
         self._record_thread.start()
         self._notify_status("recording")
 
-    def stop_recording(self) -> tuple[np.ndarray, float] | None:
+    def stop_recording(
+        self, min_duration: float = 0.0
+    ) -> tuple[np.ndarray, float] | None:
         """Stop recording and return audio data with duration.
 
+        Args:
+            min_duration: Recordings shorter than this (seconds) are discarded
+                without joining their chunks; an empty array is returned.
+
         Returns:
             Tuple of (audio_data as numpy array, duration in seconds) or None if no data.
         """
@@ -71,6 +81,9 @@ class AudioRecorder:
         with self._lock:
             if not self._audio_data:
                 return None
+            if duration < min_duration:
+                self._audio_data = []
+                return np.empty(0, dtype=np.float32), duration
             audio = np.concatenate(self._audio_data)
             self._audio_data = []  # Clear after use
 
@@ -1,6 +1,7 @@
 """Settings window using tkinter."""
 
 import logging
+import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
@@ -30,6 +31,9 @@ class SettingsWindow:
     _BORDER = "#262a36"
     _FIELD_BORDER = "#323847"
 
+    # How often the Tk thread checks for a close requested from another thread
+    _CLOSE_POLL_MS = 50
+
     def __init__(
         self,
         config: Config,
@@ -48,6 +52,7 @@ class SettingsWindow:
         self.on_save = on_save
         self.on_capture_state_changed = on_capture_state_changed
         self._window: tk.Tk | None = None
+        self._close_requested = threading.Event()  # Set by request_close()
         self._hotkey_var: tk.StringVar | None = None
         self._mode_var: tk.StringVar | None = None
         self._model_var: tk.StringVar | None = None
@@ -949,8 +954,22 @@ class SettingsWindow:
         y = (self._window.winfo_screenheight() // 2) - (height // 2)
         self._window.geometry(f"{width}x{height}+{x}+{y}")
 
+        self._window.after(self._CLOSE_POLL_MS, self._poll_close_request)
         self._window.mainloop()
 
+    def request_close(self) -> None:
+        """Ask the window to close. Safe to call from any thread."""
+        self._close_requested.set()
+
+    def _poll_close_request(self) -> None:
+        """Close the window once request_close() has been called."""
+        if self._window is None:
+            return
+        if self._close_requested.is_set():
+            self._close()
+        else:
+            self._window.after(self._CLOSE_POLL_MS, self._poll_close_request)
+
     def _update_model_info(self) -> None:
         """Update model info label."""
         if self._model_var and self._model_info_label:
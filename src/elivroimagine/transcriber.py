@@ -44,6 +44,25 @@ class APIKeyMissingError(TranscriptionError):
     pass
 
 
+def _normalize_audio(audio: np.ndarray) -> np.ndarray:
+    """Return audio as float32 scaled into [-1, 1].
+
+    The recorder already produces float32, so this only copies when the
+    audio actually needs converting or rescaling.
+
+    Args:
+        audio: Audio samples.
+
+    Returns:
+        Normalized float32 audio (the input array itself when unchanged).
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    low, high = audio.min(), audio.max()
+    if high > 1.0 or low < -1.0:
+        audio = audio / max(abs(high), abs(low))
+    return audio
+
+
 class TranscriptionBackend(Protocol):
     """Protocol for transcription backends."""
 
@@ -63,8 +82,10 @@ class LocalTranscriber:
         self,
         config: WhisperConfig,
         on_progress: Callable[[str], None] | None = None,
+        num_workers: int = 1,
     ) -> None:
         self.config = config
+        self._num_workers = num_workers  # Parallel transcribe() calls on one model
         self._model: object | None = None
         self._model_size: str | None = None
         self._model_lock = threading.Lock()
@@ -117,6 +138,7 @@ class LocalTranscriber:
                         self.config.model_size,
                         device=device,
                         compute_type=compute_type,
+                        num_workers=self._num_workers,
                     )
                 except Exception as cuda_err:
                     if device == "cuda":
@@ -133,6 +155,7 @@ class LocalTranscriber:
                             self.config.model_size,
                             device=device,
                             compute_type=compute_type,
+                            num_workers=self._num_workers,
                         )
                     else:
                         raise
@@ -147,10 +170,7 @@ class LocalTranscriber:
 
     def _do_transcribe(self, audio: np.ndarray, model: object) -> str:
         """Perform the actual transcription (called in thread for timeout)."""
-        # Normalize audio
-        audio = audio.astype(np.float32)
-        if audio.max() > 1.0 or audio.min() < -1.0:
-            audio = audio / max(abs(audio.max()), abs(audio.min()))
+        audio = _normalize_audio(audio)
 
         # Build transcribe kwargs - omit language for auto-detection
         transcribe_kwargs = {
@@ -215,6 +235,7 @@ class LocalTranscriber:
                 self.config.model_size,
                 device="cpu",
                 compute_type="int8",
+                num_workers=self._num_workers,
             )
             self._model_size = self.config.model_size
             logger.info("Whisper model reloaded on CPU")
@@ -316,10 +337,7 @@ class BergetTranscriber:
 
     def _audio_to_wav_bytes(self, audio: np.ndarray, sample_rate: int) -> bytes:
         """Convert numpy audio array to WAV bytes."""
-        # Normalize audio
-        audio = audio.astype(np.float32)
-        if audio.max() > 1.0 or audio.min() < -1.0:
-            audio = audio / max(abs(audio.max()), abs(audio.min()))
+        audio = _normalize_audio(audio)
 
         # Convert to 16-bit PCM
         audio_int16 = (audio * 32767).astype(np.int16)
@@ -486,6 +504,7 @@ class Transcriber:
         return LocalTranscriber(
             config=self.config,
             on_progress=self._on_progress,
+            num_workers=self.transcription_config.max_workers,
         )
 
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
@@ -1,5 +1,6 @@
 """Tests for main application orchestrator."""
 
+import os
 import threading
 import time
 from pathlib import Path
@@ -27,6 +28,7 @@ def _create_app(tmp_path: Path) -> "ElivroImagineApp":
         mock_config.devtracker_hotkey = MagicMock()
         mock_config.devtracker_hotkey.enabled = False
         mock_config.sound = MagicMock()
+        mock_config.transcription.max_workers = 2
         mock_config.get_config_dir.return_value = tmp_path
         mock_config_class.load.return_value = mock_config
         mock_config_class.get_config_path.return_value = tmp_path / "config.yaml"
@@ -87,6 +89,7 @@ class TestAppInitialization:
             mock_config.devtracker_hotkey = MagicMock()
             mock_config.devtracker_hotkey.enabled = False
             mock_config.sound = MagicMock()
+            mock_config.transcription.max_workers = 2
             mock_config.get_config_dir.return_value = tmp_path
             mock_config_class.load.return_value = mock_config
             mock_config_class.get_config_path.return_value = tmp_path / "config.yaml"
@@ -123,6 +126,7 @@ class TestAppRecordingCallbacks:
             app = _create_app(tmp_path)
             app.config.sound.enabled = True
             app.config.sound.start_volume = 0.8
+            app._refresh_cached_config()
             app._on_save_recording_start()
 
             mock_play.assert_called_once_with(0.8)
@@ -133,6 +137,7 @@ class TestAppRecordingCallbacks:
             app = _create_app(tmp_path)
             app.config.sound.enabled = True
             app.config.sound.stop_volume = 0.7
+            app._refresh_cached_config()
             app.recorder.stop_recording.return_value = None
             # Must start recording first to own it
             app._do_recording_start("save")
@@ -140,6 +145,22 @@ class TestAppRecordingCallbacks:
 
             mock_play.assert_called_once_with(0.7)
 
+    def test_settings_saved_refreshes_sound_config(self, tmp_path: Path) -> None:
+        """Saved settings take effect on the next recording start."""
+        with patch("elivroimagine.app.play_start_sound") as mock_play:
+            app = _create_app(tmp_path)
+            new_config = MagicMock()
+            new_config.sound.enabled = True
+            new_config.sound.start_volume = 0.3
+            new_config.paste_hotkey.enabled = False
+            new_config.devtracker.enabled = False
+            new_config.devtracker_hotkey.enabled = False
+
+            app._on_settings_saved(new_config)
+            app._on_save_recording_start()
+
+            mock_play.assert_called_once_with(0.3)
+
     def test_on_recording_start_without_recorder(self, tmp_path: Path) -> None:
         """Recording start with unavailable recorder shows notification."""
         app = _create_app(tmp_path)
@@ -149,6 +170,20 @@ class TestAppRecordingCallbacks:
         app._on_save_recording_start()
         app.tray.notify.assert_called()
 
+    def test_saved_notification_preview_capped_at_100_chars(
+        self, tmp_path: Path
+    ) -> None:
+        """Long transcriptions are previewed as 97 chars plus an ellipsis."""
+        app = _create_app(tmp_path)
+        app._devtracker = None
+        text = "word " * 40
+
+        app._save_text_or_devtracker(text, 2.0)
+
+        app.tray.notify.assert_called_once_with(
+            "Transcription Saved", text[:97] + "..."
+        )
+
 
 class TestAppShutdown:
     """Test application shutdown."""
@@ -173,6 +208,32 @@ class TestAppShutdown:
 
             app.recorder.stop_recording.assert_called_once()
 
+    def test_quit_flushes_queued_log_records(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Logging goes through a queue listener that quit drains and stops."""
+        import logging
+
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        with patch("elivroimagine.sounds.cleanup_mixer"), patch(
+            "elivroimagine.app.atexit.register"
+        ):
+            app = _create_app(tmp_path)
+            listener = app._log_listener
+            assert listener is not None
+            assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+            app.recorder.is_recording = False
+            app._quit()
+
+        assert app._log_listener is None
+        for handler in listener.handlers:
+            handler.close()
+        log_text = (tmp_path / "logs" / "elivroimagine.log").read_text("utf-8")
+        assert "INFO - ElivroImagine shutdown complete" in log_text
+
     def test_quit_releases_instance_lock(self, tmp_path: Path) -> None:
         """Quit releases the single instance lock."""
         with patch("elivroimagine.sounds.cleanup_mixer"):
@@ -182,19 +243,257 @@ class TestAppShutdown:
 
             app._instance_lock.release.assert_called_once()
 
-    def test_quit_shuts_down_thread_pool(self, tmp_path: Path) -> None:
-        """Quit shuts down the transcription thread pool."""
-        with patch("elivroimagine.sounds.cleanup_mixer"):
+    def test_quit_releases_run_loop(self, tmp_path: Path) -> None:
+        """Quit wakes the main thread blocked in run()."""
+        with patch("elivroimagine.sounds.cleanup_mixer"), patch(
+            "elivroimagine.app.init_mixer"
+        ):
             app = _create_app(tmp_path)
             app.recorder.is_recording = False
+            app.transcriber = None
 
-            # Mock the thread pool
-            mock_pool = MagicMock()
-            app._transcription_pool = mock_pool
+            run_thread = threading.Thread(target=app.run, daemon=True)
+            run_thread.start()
+            time.sleep(0.1)
+            assert run_thread.is_alive()
 
             app._quit()
+            run_thread.join(timeout=2.0)
+
+            assert not run_thread.is_alive()
+            assert app._shutdown_event.is_set()
+
+    def test_transcriptions_bounded_by_semaphore(self, tmp_path: Path) -> None:
+        """No more than the configured number of transcriptions run at once."""
+        app = _create_app(tmp_path)
+        workers = app._transcription_workers
+        assert workers == min(2, os.cpu_count() or 1)
+        release = threading.Event()
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def job(audio: np.ndarray, duration: float) -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            release.wait(timeout=2.0)
+            with lock:
+                running -= 1
+
+        audio = np.full(16000, 0.1, dtype=np.float32)
+        app.recorder.stop_recording.return_value = (audio, 1.0)
+        for _ in range(workers + 2):
+            app._spawn_transcription("save", job)
+        time.sleep(0.1)
+        assert peak == workers
+
+        release.set()
+        deadline = time.monotonic() + 2.0
+        while running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert running == 0
+        assert peak == workers
+
+    def test_queued_transcription_dropped_after_quit(self, tmp_path: Path) -> None:
+        """A transcription still waiting for a worker slot is not run after quit."""
+        app = _create_app(tmp_path)
+        audio = np.full(16000, 0.1, dtype=np.float32)
+        app.recorder.stop_recording.return_value = (audio, 1.0)
+        handler = MagicMock()
+
+        app._shutdown_event.set()
+        app._collect_and_dispatch("save", handler)
+
+        handler.assert_not_called()
+
+    def test_recording_stop_hands_audio_to_worker(self, tmp_path: Path) -> None:
+        """Recording stop collects the audio off the hotkey thread."""
+        app = _create_app(tmp_path)
+        audio = np.full(16000, 0.1, dtype=np.float32)
+        app.recorder.stop_recording.return_value = (audio, 1.0)
+        app._do_recording_start("save")
+        handled = threading.Event()
+        calls: list[tuple[object, float, str]] = []
+
+        def record_call(passed_audio: np.ndarray, duration: float) -> None:
+            calls.append((passed_audio, duration, threading.current_thread().name))
+            handled.set()
+
+        with patch.object(app, "_transcribe_and_save", side_effect=record_call):
+            app._on_save_recording_stop()
+            assert handled.wait(timeout=2.0)
+
+        assert calls == [(audio, 1.0, "transcription")]
+        assert app._active_recording_source is None
 
-            mock_pool.shutdown.assert_called_once()
+    def test_silent_recording_not_transcribed(self, tmp_path: Path) -> None:
+        """Silent audio is rejected before it waits for a worker slot."""
+        app = _create_app(tmp_path)
+        audio = np.zeros(16000, dtype=np.float32)
+        app.recorder.stop_recording.return_value = (audio, 1.0)
+        handler = MagicMock()
+
+        app._collect_and_dispatch("save", handler)
+
+        handler.assert_not_called()
+        app.tray.notify.assert_called_with("ElivroImagine", "No speech detected")
+
+    def test_settings_reuse_one_worker_thread(self, tmp_path: Path) -> None:
+        """Reopening settings reuses the worker; quit releases it."""
+        app = _create_app(tmp_path)
+        opened = threading.Event()
+        close_window = threading.Event()
+
+        def show() -> None:
+            opened.set()
+            close_window.wait(timeout=2.0)
+
+        with patch("elivroimagine.app.SettingsWindow") as mock_window_class, patch(
+            "elivroimagine.sounds.cleanup_mixer"
+        ):
+            mock_window_class.return_value.show.side_effect = show
+            app._show_settings()
+            assert opened.wait(timeout=2.0)
+            worker = app._settings_thread
+
+            # Already open: no second window
+            app._show_settings()
+            close_window.set()
+            deadline = time.monotonic() + 2.0
+            while app._settings_open and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            opened.clear()
+            close_window.clear()
+            app._show_settings()
+            assert opened.wait(timeout=2.0)
+            assert app._settings_thread is worker
+            assert mock_window_class.call_count == 2
+
+            close_window.set()
+            app.recorder.is_recording = False
+            app._quit()
+            worker.join(timeout=2.0)
+            assert not worker.is_alive()
+
+    def test_quit_closes_open_settings_window(self, tmp_path: Path) -> None:
+        """Quit asks an open settings window to close instead of waiting."""
+        app = _create_app(tmp_path)
+        opened = threading.Event()
+        close_window = threading.Event()
+
+        def show() -> None:
+            opened.set()
+            close_window.wait(timeout=2.0)
+
+        with patch("elivroimagine.app.SettingsWindow") as mock_window_class, patch(
+            "elivroimagine.sounds.cleanup_mixer"
+        ):
+            window = mock_window_class.return_value
+            window.show.side_effect = show
+            window.request_close.side_effect = close_window.set
+            app._show_settings()
+            assert opened.wait(timeout=2.0)
+
+            app.recorder.is_recording = False
+            app._quit()
+
+            window.request_close.assert_called_once()
+            app._settings_thread.join(timeout=2.0)
+            assert not app._settings_thread.is_alive()
+            assert app._settings_window is None
+
+
+class TestSettingsSaved:
+    """Test applying saved settings."""
+
+    def test_autostart_applied_only_on_change(self, tmp_path: Path) -> None:
+        """Autostart registry is touched once per change, via one manager."""
+        app = _create_app(tmp_path)
+        new_config = MagicMock()
+        new_config.paste_hotkey.enabled = False
+        new_config.devtracker.enabled = False
+        new_config.devtracker_hotkey.enabled = False
+        new_config.startup.start_with_windows = True
+
+        with patch("elivroimagine.app.sys.platform", "win32"), patch(
+            "elivroimagine.windows.WindowsStartupManager"
+        ) as mock_manager_class:
+            app._on_settings_saved(new_config)
+            app._on_settings_saved(new_config)
+            new_config.startup.start_with_windows = False
+            app._on_settings_saved(new_config)
+
+        mock_manager_class.assert_called_once()
+        manager = mock_manager_class.return_value
+        manager.enable_autostart.assert_called_once()
+        manager.disable_autostart.assert_called_once()
+
+    def test_unchanged_sections_not_pushed(self, tmp_path: Path) -> None:
+        """Only components whose config section changed are updated."""
+        import copy
+
+        from elivroimagine.config import Config
+
+        app = _create_app(tmp_path)
+        app.config = Config()
+
+        sound_only = copy.deepcopy(app.config)
+        sound_only.sound.enabled = False
+        app._on_settings_saved(sound_only)
+
+        app.hotkey.begin_batch.assert_not_called()
+        app.transcriber.update_config.assert_not_called()
+        app.transcriber.update_transcription_config.assert_not_called()
+        app.storage.update_config.assert_not_called()
+
+        new_language = copy.deepcopy(sound_only)
+        new_language.whisper.language = "sv"
+        app._on_settings_saved(new_language)
+
+        app.transcriber.update_config.assert_called_once_with(new_language.whisper)
+        app.storage.update_config.assert_not_called()
+
+    def test_new_microphone_applies_to_recorder(self, tmp_path: Path) -> None:
+        """A microphone chosen in settings is used without a restart."""
+        import copy
+
+        from elivroimagine.config import Config
+
+        app = _create_app(tmp_path)
+        app.config = Config()
+
+        new_mic = copy.deepcopy(app.config)
+        new_mic.recording.microphone_id = "3"
+        app._on_settings_saved(new_mic)
+
+        app.recorder.update_config.assert_called_once_with(new_mic.recording)
+
+    def test_tray_folder_updated_only_when_path_changes(
+        self, tmp_path: Path
+    ) -> None:
+        """The tray is told about a new folder only when the path moves."""
+        import copy
+
+        from elivroimagine.config import Config
+
+        app = _create_app(tmp_path)
+        app.config = Config()
+        app.config.storage.transcriptions_dir = str(tmp_path / "a")
+        app._transcriptions_folder = app.config.storage.transcriptions_path
+
+        same_path = copy.deepcopy(app.config)
+        same_path.storage.transcriptions_dir = str(tmp_path / "a") + "/"
+        app._on_settings_saved(same_path)
+        app.tray.update_transcriptions_folder.assert_not_called()
+
+        moved = copy.deepcopy(same_path)
+        moved.storage.transcriptions_dir = str(tmp_path / "b")
+        app._on_settings_saved(moved)
+        app.tray.update_transcriptions_folder.assert_called_once_with(tmp_path / "b")
+        assert app._transcriptions_folder == tmp_path / "b"
 
 
 class TestRecordingConflictGuard:
@@ -216,11 +515,25 @@ class TestRecordingConflictGuard:
         assert app._do_recording_start("save") is False
         assert app._active_recording_source == "paste"
 
+    def test_ownership_held_until_audio_collected(self, tmp_path: Path) -> None:
+        """A new recording cannot start while the previous one is drained."""
+        app = _create_app(tmp_path)
+        app.recorder.stop_recording.return_value = None
+
+        app._do_recording_start("save")
+        assert app._arm_stop("save") is True
+        assert app._arm_stop("save") is False
+        assert app._do_recording_start("paste") is False
+
+        app._collect_recording("save")
+        assert app._do_recording_start("paste") is True
+
     def test_stop_wrong_source_ignored(self, tmp_path: Path) -> None:
         """Stopping recording from wrong source is ignored."""
         with patch("elivroimagine.app.play_start_sound"):
             app = _create_app(tmp_path)
             app.config.sound.enabled = False
+            app._refresh_cached_config()
 
             app._do_recording_start("save")
             result = app._do_recording_stop("paste")
@@ -233,6 +546,7 @@ class TestRecordingConflictGuard:
         with patch("elivroimagine.app.play_stop_sound"):
             app = _create_app(tmp_path)
             app.config.sound.enabled = False
+            app._refresh_cached_config()
             audio = np.zeros(16000, dtype=np.float32)
             app.recorder.stop_recording.return_value = (audio, 1.0)
 
@@ -247,6 +561,7 @@ class TestRecordingConflictGuard:
         with patch("elivroimagine.app.play_stop_sound"):
             app = _create_app(tmp_path)
             app.config.sound.enabled = False
+            app._refresh_cached_config()
             app.recorder.stop_recording.return_value = None
 
             app._do_recording_start("save")
@@ -329,6 +644,22 @@ class TestTranscribeAndPaste:
         ]
         assert len(error_calls) > 0
 
+    def test_transcribe_and_paste_timeout(self, tmp_path: Path) -> None:
+        """Transcription timeout notifies and clears the transcribing state."""
+        from elivroimagine.transcriber import TranscriptionTimeoutError
+
+        app = _create_app(tmp_path)
+        app.paster = MagicMock()
+
+        audio = np.zeros(16000, dtype=np.float32)
+        app.transcriber.transcribe.side_effect = TranscriptionTimeoutError("slow")
+
+        app._transcribe_and_paste(audio, 1.0)
+
+        app.paster.paste_text.assert_not_called()
+        assert "timed out" in str(app.tray.notify.call_args)
+        app.tray.set_transcribing.assert_called_with(False)
+
 
 class TestDevTrackerHotkeyConflicts:
     """Test recording conflicts involving the devtracker hotkey."""
@@ -370,6 +701,7 @@ class TestDevTrackerHotkeyConflicts:
         with patch("elivroimagine.app.play_start_sound"):
             app = _create_app(tmp_path)
             app.config.sound.enabled = False
+            app._refresh_cached_config()
 
             app._do_recording_start("devtracker")
             result = app._do_recording_stop("save")
@@ -382,6 +714,7 @@ class TestDevTrackerHotkeyConflicts:
         with patch("elivroimagine.app.play_stop_sound"):
             app = _create_app(tmp_path)
             app.config.sound.enabled = False
+            app._refresh_cached_config()
             audio = np.zeros(16000, dtype=np.float32)
             app.recorder.stop_recording.return_value = (audio, 1.0)
 
@@ -18,16 +18,16 @@ def _mock_api_response(data: dict) -> MagicMock:
     """Create a mock requests.post response returning the given JSON."""
     resp = MagicMock()
     resp.status_code = 200
-    resp.json.return_value = {
-        "choices": [{"message": {"content": json.dumps(data)}}]
-    }
+    resp.content = json.dumps(
+        {"choices": [{"message": {"content": json.dumps(data)}}]}
+    ).encode()
     return resp
 
 
 class TestCreateIntent:
     """Test classification with create intent."""
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_create_intent_all_fields(self, mock_post: MagicMock) -> None:
         """Create intent populates all fields."""
         mock_post.return_value = _mock_api_response(
@@ -53,7 +53,7 @@ class TestCreateIntent:
         assert result.effort == "small"
         assert result.task_id is None
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_missing_intent_defaults_to_create(self, mock_post: MagicMock) -> None:
         """Missing intent field defaults to create."""
         mock_post.return_value = _mock_api_response(
@@ -72,7 +72,7 @@ class TestCreateIntent:
         assert result.title == "Add dark mode"
         assert result.task_id is None
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_unknown_intent_defaults_to_create(self, mock_post: MagicMock) -> None:
         """Unknown intent value defaults to create."""
         mock_post.return_value = _mock_api_response(
@@ -90,7 +90,7 @@ class TestCreateIntent:
 
         assert result.intent == "create"
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_create_validates_priority_and_effort(self, mock_post: MagicMock) -> None:
         """Invalid priority/effort fall back to medium for create."""
         mock_post.return_value = _mock_api_response(
@@ -109,7 +109,7 @@ class TestCreateIntent:
         assert result.priority == "medium"
         assert result.effort == "medium"
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_create_fuzzy_matches_category(self, mock_post: MagicMock) -> None:
         """Category fuzzy-matches against provided list."""
         mock_post.return_value = _mock_api_response(
@@ -133,7 +133,7 @@ class TestCreateIntent:
 class TestUpdateIntent:
     """Test classification with update intent."""
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_with_task_id_and_fields(self, mock_post: MagicMock) -> None:
         """Update intent extracts task_id and changed fields only."""
         mock_post.return_value = _mock_api_response(
@@ -155,7 +155,7 @@ class TestUpdateIntent:
         assert result.category is None
         assert result.effort is None
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_multiple_fields(self, mock_post: MagicMock) -> None:
         """Update intent with multiple changed fields."""
         mock_post.return_value = _mock_api_response(
@@ -178,7 +178,7 @@ class TestUpdateIntent:
         assert result.priority is None
         assert result.effort is None
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_missing_task_id_raises(self, mock_post: MagicMock) -> None:
         """Update intent without task_id raises ClassificationError."""
         mock_post.return_value = _mock_api_response(
@@ -191,7 +191,7 @@ class TestUpdateIntent:
         with pytest.raises(ClassificationError, match="task_id"):
             classify_transcription("change priority to high", "fake-key")
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_invalid_task_id_raises(self, mock_post: MagicMock) -> None:
         """Update intent with non-integer task_id raises ClassificationError."""
         mock_post.return_value = _mock_api_response(
@@ -205,7 +205,7 @@ class TestUpdateIntent:
         with pytest.raises(ClassificationError, match="must be an integer"):
             classify_transcription("update task abc", "fake-key")
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_validates_priority(self, mock_post: MagicMock) -> None:
         """Invalid priority in update falls back to medium."""
         mock_post.return_value = _mock_api_response(
@@ -220,7 +220,7 @@ class TestUpdateIntent:
 
         assert result.priority == "medium"
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_validates_effort(self, mock_post: MagicMock) -> None:
         """Invalid effort in update falls back to medium."""
         mock_post.return_value = _mock_api_response(
@@ -235,7 +235,7 @@ class TestUpdateIntent:
 
         assert result.effort == "medium"
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_update_fuzzy_matches_category(self, mock_post: MagicMock) -> None:
         """Category fuzzy-matches for update intent too."""
         mock_post.return_value = _mock_api_response(
@@ -252,7 +252,7 @@ class TestUpdateIntent:
 
         assert result.category == "Backend"
 
-    @patch("elivroimagine.classifier.requests.post")
+    @patch("elivroimagine.classifier.requests.Session.post")
     def test_intent_case_insensitive(self, mock_post: MagicMock) -> None:
         """Intent matching is case-insensitive."""
         mock_post.return_value = _mock_api_response(
@@ -267,3 +267,70 @@ class TestUpdateIntent:
 
         assert result.intent == "update"
         assert result.task_id == 1
+
+
+class TestSession:
+    """Test HTTP connection reuse across classifications."""
+
+    def test_session_reused_across_calls(self) -> None:
+        """Consecutive classifications share one keep-alive session."""
+        from elivroimagine.classifier import _get_session
+
+        with patch("elivroimagine.classifier._session", None):
+            first = _get_session()
+            assert _get_session() is first
+            assert first.get_adapter("https://api.berget.ai")._pool_maxsize == 4
+
+
+class TestStripMarkdownFences:
+    """Test removal of markdown fences around the model's JSON."""
+
+    def test_strips_fences(self) -> None:
+        """Opening fence with language tag and closing fence are removed."""
+        from elivroimagine.classifier import _strip_markdown_fences
+
+        assert _strip_markdown_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert _strip_markdown_fences('{"a": 1}') == '{"a": 1}'
+
+
+class TestSystemPrompt:
+    """Test system prompt construction."""
+
+    def test_prompt_lists_categories_and_is_cached(self) -> None:
+        """The prompt lists each category and is built once per category list."""
+        from elivroimagine.classifier import _build_system_prompt
+
+        prompt = _build_system_prompt(("Frontend", "Backend"))
+
+        assert "- Frontend\n- Backend" in prompt
+        assert _build_system_prompt(("Frontend", "Backend")) is prompt
+
+
+class TestApiErrors:
+    """Test reporting of failed API calls."""
+
+    @patch("elivroimagine.classifier.requests.Session.post")
+    def test_error_status_includes_body_snippet(self, mock_post: MagicMock) -> None:
+        """Non-200 responses raise with the start of the response body."""
+        resp = MagicMock()
+        resp.status_code = 500
+        resp.content = b"upstream \xff failure" + b"x" * 500
+        mock_post.return_value = resp
+
+        with pytest.raises(ClassificationError) as exc_info:
+            classify_transcription("text", "fake-key")
+
+        message = str(exc_info.value)
+        assert message.startswith("API error 500: upstream � failure")
+        assert len(message) < 230
+
+    @patch("elivroimagine.classifier.requests.Session.post")
+    def test_malformed_body_raises(self, mock_post: MagicMock) -> None:
+        """A body that is not JSON raises ClassificationError."""
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.content = b"<html>gateway timeout</html>"
+        mock_post.return_value = resp
+
+        with pytest.raises(ClassificationError, match="Unexpected API response"):
+            classify_transcription("text", "fake-key")
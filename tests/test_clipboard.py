@@ -1,5 +1,6 @@
 """Tests for clipboard module."""
 
+import logging
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -94,6 +95,23 @@ class TestPasterPasteText:
                         # Should not have called _set_clipboard to restore
                         mock_set.assert_not_called()
 
+    @patch.object(sys, "platform", "win32")
+    def test_paste_returns_without_post_paste_wait_when_not_restoring(
+        self,
+    ) -> None:
+        """Without a restore pending, paste doesn't wait after Ctrl+V."""
+        from elivroimagine.clipboard import Paster
+
+        paster = Paster(restore_clipboard=False)
+
+        with patch.object(paster, "_set_clipboard_with_retry", return_value=True):
+            with patch.object(paster, "_get_clipboard", return_value="new text"):
+                with patch.object(paster, "_simulate_ctrl_v"):
+                    with patch("time.sleep") as mock_sleep:
+                        assert paster.paste_text("new text") is True
+
+        assert 0.2 not in [c.args[0] for c in mock_sleep.call_args_list]
+
     @patch.object(sys, "platform", "win32")
     def test_paste_fails_when_set_clipboard_fails(self) -> None:
         """Paste returns False when clipboard cannot be set."""
@@ -106,12 +124,29 @@ class TestPasterPasteText:
             assert result is False
 
     @patch.object(sys, "platform", "win32")
-    def test_paste_fails_when_verification_fails(self) -> None:
-        """Paste returns False when clipboard verification fails."""
+    def test_paste_skips_verification_unless_debugging(self) -> None:
+        """The clipboard isn't read back after a successful set."""
         from elivroimagine.clipboard import Paster
 
         paster = Paster()
 
+        with patch.object(paster, "_set_clipboard_with_retry", return_value=True):
+            with patch.object(paster, "_get_clipboard") as mock_get:
+                with patch.object(paster, "_simulate_ctrl_v"):
+                    assert paster.paste_text("test text") is True
+
+        mock_get.assert_not_called()
+
+    @patch.object(sys, "platform", "win32")
+    def test_paste_fails_when_verification_fails(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Paste returns False when clipboard verification fails while debugging."""
+        from elivroimagine.clipboard import Paster
+
+        caplog.set_level(logging.DEBUG, logger="elivroimagine.clipboard")
+        paster = Paster()
+
         with patch.object(paster, "_set_clipboard_with_retry", return_value=True):
             with patch.object(paster, "_get_clipboard", return_value="wrong text"):
                 result = paster.paste_text("test text")
@@ -128,19 +163,61 @@ class TestPasterSimulateCtrlV:
 
         paster = Paster()
 
-        # Mock the ctypes calls
-        with patch("ctypes.windll") as mock_windll:
-            mock_user32 = MagicMock()
-            mock_windll.user32 = mock_user32
-            mock_user32.SendInput.return_value = 4
-
+        # Mock the prototyped Win32 function
+        with patch("elivroimagine.clipboard._SendInput", return_value=4) as mock_send:
             paster._simulate_ctrl_v()
 
             # Verify SendInput was called with 4 inputs
-            mock_user32.SendInput.assert_called_once()
-            args = mock_user32.SendInput.call_args[0]
+            mock_send.assert_called_once()
+            args = mock_send.call_args[0]
             assert args[0] == 4  # 4 key events
 
+    def test_pynput_fallback_reuses_controller(self) -> None:
+        """The pynput fallback creates its keyboard controller only once."""
+        from elivroimagine.clipboard import Paster, _pynput_keyboard
+
+        fake_keyboard = MagicMock()
+        _pynput_keyboard.cache_clear()
+        try:
+            with patch.dict(
+                sys.modules,
+                {
+                    "pynput": MagicMock(keyboard=fake_keyboard),
+                    "pynput.keyboard": fake_keyboard,
+                },
+            ):
+                paster = Paster()
+                paster._pynput_paste()
+                paster._pynput_paste()
+        finally:
+            _pynput_keyboard.cache_clear()
+
+        fake_keyboard.Controller.assert_called_once()
+        controller = fake_keyboard.Controller.return_value
+        assert controller.press.call_count == 4
+        controller.press.assert_any_call(fake_keyboard.Key.ctrl)
+
+    def test_ctrl_v_inputs_prebuilt(self) -> None:
+        """The Ctrl+V events are built once, in press/release order."""
+        from elivroimagine.clipboard import (
+            _CTRL_V_INPUTS,
+            INPUT_KEYBOARD,
+            KEYEVENTF_KEYUP,
+            VK_CONTROL,
+            VK_V,
+        )
+
+        events = [
+            (event.type, event.union.ki.wVk, event.union.ki.dwFlags)
+            for event in _CTRL_V_INPUTS
+        ]
+        assert events == [
+            (INPUT_KEYBOARD, VK_CONTROL, 0),
+            (INPUT_KEYBOARD, VK_V, 0),
+            (INPUT_KEYBOARD, VK_V, KEYEVENTF_KEYUP),
+            (INPUT_KEYBOARD, VK_CONTROL, KEYEVENTF_KEYUP),
+        ]
+
 
 class TestPasterClipboard:
     """Tests for clipboard operations."""
@@ -164,3 +241,68 @@ class TestPasterClipboard:
                 result = paster._set_clipboard_with_retry("test", max_retries=3)
                 assert result is True
                 assert call_count[0] == 3
+
+    def test_set_clipboard_with_retry_backs_off_exponentially(self) -> None:
+        """Retry delays double while the clipboard is held by another window."""
+        from elivroimagine.clipboard import ERROR_ACCESS_DENIED, Paster
+
+        paster = Paster()
+
+        def mock_set_clipboard(text: str) -> bool:
+            paster._last_set_error = ERROR_ACCESS_DENIED
+            return False
+
+        with patch.object(paster, "_set_clipboard", side_effect=mock_set_clipboard):
+            with patch("elivroimagine.clipboard.random.uniform", return_value=0.0):
+                with patch("time.sleep") as mock_sleep:
+                    result = paster._set_clipboard_with_retry("test", max_retries=4)
+
+        assert result is False
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.015, 0.03, 0.06])
+
+    def test_set_clipboard_with_retry_stops_on_other_errors(self) -> None:
+        """Errors other than access denied are not retried."""
+        from elivroimagine.clipboard import Paster
+
+        paster = Paster()
+
+        def mock_set_clipboard(text: str) -> bool:
+            paster._last_set_error = 8  # ERROR_NOT_ENOUGH_MEMORY
+            return False
+
+        with patch.object(
+            paster, "_set_clipboard", side_effect=mock_set_clipboard
+        ) as mock_set:
+            with patch("time.sleep") as mock_sleep:
+                assert paster._set_clipboard_with_retry("test") is False
+
+        mock_set.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_set_clipboard_writes_null_terminated_utf16(self) -> None:
+        """Clipboard buffer holds the UTF-16 text plus a null terminator."""
+        import ctypes
+
+        from elivroimagine.clipboard import Paster
+
+        paster = Paster()
+        text = "héllo 👋"
+        expected = text.encode("utf-16-le") + b"\0\0"
+        buffer = ctypes.create_string_buffer(b"\xff" * 64)
+
+        mock_alloc = MagicMock(return_value=1)
+        with patch.multiple(
+            "elivroimagine.clipboard",
+            _GlobalAlloc=mock_alloc,
+            _GlobalLock=MagicMock(return_value=ctypes.addressof(buffer)),
+            _GlobalUnlock=MagicMock(),
+            _OpenClipboard=MagicMock(return_value=1),
+            _EmptyClipboard=MagicMock(),
+            _SetClipboardData=MagicMock(return_value=1),
+            _CloseClipboard=MagicMock(),
+        ):
+            assert paster._set_clipboard(text) is True
+
+        mock_alloc.assert_called_once_with(0x0002, len(expected))
+        assert buffer.raw[: len(expected)] == expected
@@ -74,6 +74,36 @@ class TestConfigLoad:
             # Other sections should use defaults
             assert config.whisper.model_size == "small"
 
+    def test_load_reuses_parse_of_unchanged_file(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Loading an unchanged file twice parses it once."""
+        import os
+
+        from elivroimagine.config import Config
+
+        config_path = temp_config_dir / "config.yaml"
+        config_path.write_text("hotkey:\n  combination: <ctrl>+<alt>+x\n")
+
+        with patch.object(Config, "get_config_path", return_value=config_path):
+            with patch("elivroimagine.config.yaml.load", wraps=yaml.load) as mock_load:
+                first = Config.load()
+                second = Config.load()
+                assert mock_load.call_count == 1
+                assert first is not second
+                assert second.hotkey.combination == "<ctrl>+<alt>+x"
+
+                config_path.write_text("hotkey:\n  combination: <ctrl>+<alt>+yy\n")
+                stat = config_path.stat()
+                os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                assert Config.load().hotkey.combination == "<ctrl>+<alt>+yy"
+                assert mock_load.call_count == 2
+
+                # save() writes through, so loading its output doesn't re-parse
+                second.save()
+                assert Config.load().hotkey.combination == "<ctrl>+<alt>+x"
+                assert mock_load.call_count == 2
+
 
 class TestConfigSave:
     """Test config saving functionality."""
@@ -97,6 +127,29 @@ class TestConfigSave:
             assert data["hotkey"]["combination"] == "<ctrl>+<alt>+x"
             assert data["whisper"]["model_size"] == "medium"
 
+    def test_save_replaces_file_atomically(self, temp_config_dir: Path) -> None:
+        """Save swaps in a fully written temp file and leaves none behind."""
+        import os
+
+        from elivroimagine.config import Config
+
+        config_path = temp_config_dir / "config.yaml"
+        config_path.write_text("old: contents\n")
+
+        with patch.object(Config, "get_config_path", return_value=config_path):
+            with patch(
+                "elivroimagine.config.os.replace", wraps=os.replace
+            ) as mock_replace:
+                Config().save()
+
+        mock_replace.assert_called_once_with(
+            config_path.with_suffix(".yaml.tmp"), config_path
+        )
+        assert list(temp_config_dir.iterdir()) == [config_path]
+        data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        assert "old" not in data
+        assert data["hotkey"]["combination"] == "<ctrl>+<alt>+r"
+
     def test_save_creates_parent_directories(self, tmp_path: Path) -> None:
         """Saving creates parent directories if needed."""
         from elivroimagine.config import Config
@@ -123,6 +176,18 @@ class TestConfigDataclasses:
         assert "~" not in str(path)
         assert path.is_absolute()
 
+    def test_storage_config_paths_follow_dir_changes(self, tmp_path: Path) -> None:
+        """Memoized storage paths are re-resolved when the dir is edited."""
+        from elivroimagine.config import StorageConfig
+
+        config = StorageConfig(transcriptions_dir=str(tmp_path / "a"))
+        assert config.transcriptions_path is config.transcriptions_path
+
+        config.transcriptions_dir = str(tmp_path / "b")
+        assert config.transcriptions_path == tmp_path / "b"
+        assert config.archive_path == tmp_path / "b" / "archive"
+        assert config == StorageConfig(transcriptions_dir=str(tmp_path / "b"))
+
     def test_storage_config_archive_path(self) -> None:
         """StorageConfig provides archive subdirectory."""
         from elivroimagine.config import StorageConfig
@@ -431,6 +496,7 @@ class TestTranscriptionConfig:
 
         assert config.backend == "local"
         assert config.berget_api_key == ""
+        assert config.max_workers == 1
 
     def test_config_has_transcription(self) -> None:
         """Config includes transcription field with defaults."""
@@ -475,11 +541,21 @@ class TestTranscriptionConfig:
             config = Config()
             config.transcription.backend = "berget"
             config.transcription.berget_api_key = "test-api-key-123"
+            config.transcription.max_workers = 2
             config.save()
 
             loaded = Config.load()
             assert loaded.transcription.backend == "berget"
             assert loaded.transcription.berget_api_key == "test-api-key-123"
+            assert loaded.transcription.max_workers == 2
+
+    def test_max_workers_clamped(self) -> None:
+        """max_workers is clamped to 1-4."""
+        from elivroimagine.config import TranscriptionConfig
+
+        assert TranscriptionConfig(max_workers=0).max_workers == 1
+        assert TranscriptionConfig(max_workers=99).max_workers == 4
+        assert TranscriptionConfig(max_workers=2).max_workers == 2
 
     def test_valid_backends_accepted(self) -> None:
         """Valid backend values are accepted."""
@@ -0,0 +1,50 @@
+"""Tests for the dev-tracker skill's API script."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[1] / ".claude" / "skills" / "dev-tracker" / "scripts"
+)
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch):
+    """Import the skill's api module with its network lookups stubbed out."""
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    import api
+
+    monkeypatch.setattr(api, "get_all_active_and_backlog_tasks", lambda: [])
+    monkeypatch.setattr(api, "get_category_map", lambda: {})
+    return api
+
+
+class TestBatchImport:
+    """Test batch task import."""
+
+    def test_failure_stops_remaining_creates_and_is_reported(
+        self, api, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A failed create cancels queued creates; results cover every task."""
+        titles = [f"Task {n}" for n in range(1, 7)]
+        tasks_file = tmp_path / "backlog.json"
+        tasks_file.write_text(json.dumps({"tasks": [{"title": t} for t in titles]}))
+
+        def create_task(title: str, **kwargs) -> dict:
+            if title == "Task 3":
+                raise api.DevTrackerError("HTTP 500: boom")
+            return {"id": titles.index(title) + 1, "title": title}
+
+        mock_create = MagicMock(side_effect=create_task)
+        monkeypatch.setattr(api, "create_task", mock_create)
+        monkeypatch.setattr(api, "BATCH_CREATE_WORKERS", 1)
+
+        result = api.batch_import_tasks(str(tasks_file))
+
+        assert mock_create.call_count == 3
+        assert [t["title"] for t in result["created"]] == ["Task 1", "Task 2"]
+        assert result["failed"][0] == {"title": "Task 3", "error": "HTTP 500: boom"}
+        assert [f["title"] for f in result["failed"][1:]] == titles[3:]
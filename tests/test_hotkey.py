@@ -249,6 +249,47 @@ class TestHotkeyLifecycle:
         # Should have registered hotkey twice (once on start, once on update)
         assert mock_pynput.add_hotkey.call_count == 2
 
+    def test_update_unchanged_does_not_restart(
+        self, mock_pynput: MagicMock
+    ) -> None:
+        """Updating to the current values keeps the registered hotkey."""
+        from elivroimagine.hotkey import HotkeyListener
+
+        listener = HotkeyListener(
+            combination="<ctrl>+<alt>+r",
+            mode="toggle",
+            on_start=MagicMock(),
+            on_stop=MagicMock(),
+        )
+
+        listener.start()
+        listener.update_combination("<ctrl>+<alt>+r")
+        listener.update_mode("toggle")
+
+        assert mock_pynput.add_hotkey.call_count == 1
+
+    def test_batch_restarts_once(self, mock_pynput: MagicMock) -> None:
+        """Changes inside a batch re-register the hotkey once at the end."""
+        from elivroimagine.hotkey import HotkeyListener
+
+        listener = HotkeyListener(
+            combination="<ctrl>+<alt>+r",
+            mode="toggle",
+            on_start=MagicMock(),
+            on_stop=MagicMock(),
+        )
+
+        listener.start()
+        listener.begin_batch()
+        listener.update_combination("<ctrl>+<shift>+r")
+        listener.update_mode("hold")
+        assert mock_pynput.add_hotkey.call_count == 1
+
+        listener.end_batch()
+
+        assert mock_pynput.add_hotkey.call_count == 2
+        assert mock_pynput.add_hotkey.call_args[0][0] == "ctrl+shift+r"
+
 
 class TestScanCodeSupport:
     """Test scan code based hotkey detection."""
@@ -325,6 +366,26 @@ class TestScanCodeSupport:
         assert listener.combination == "§"
         assert listener.scan_code == 41
 
+    def test_update_scan_code_listener_restarts(
+        self, mock_pynput: MagicMock
+    ) -> None:
+        """A running scan code listener re-registers on combination change."""
+        from elivroimagine.hotkey import HotkeyListener
+
+        listener = HotkeyListener(
+            combination="§",
+            mode="toggle",
+            on_start=MagicMock(),
+            on_stop=MagicMock(),
+            scan_code=41,
+        )
+
+        listener.start()
+        listener.update_combination("<ctrl>+<alt>+r")
+
+        mock_pynput.unhook.assert_called()
+        mock_pynput.add_hotkey.assert_called_once()
+
 
 class TestCombinationNormalization:
     """Test combination string normalization."""
@@ -0,0 +1,56 @@
+"""Tests for the command-line entry point."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from elivroimagine.__main__ import main
+
+
+class TestMainArgs:
+    """Tests for hand-rolled argument parsing in main()."""
+
+    @pytest.mark.parametrize("flag", ["-h", "--help"])
+    def test_help_prints_usage(
+        self, flag: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --help prints usage and exits cleanly."""
+        assert main([flag]) == 0
+
+        out = capsys.readouterr().out
+        assert "[--install]" in out
+        assert "Create Start Menu shortcut and exit" in out
+
+    def test_unknown_argument_is_rejected(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test unknown arguments exit with argparse's usage error code."""
+        assert main(["--bogus"]) == 2
+
+        err = capsys.readouterr().err
+        assert "unrecognized arguments: --bogus" in err
+
+    def test_install_unsupported_off_windows(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test --install refuses to run on non-Windows platforms."""
+        with patch("elivroimagine.__main__.sys.platform", "linux"):
+            assert main(["--install"]) == 1
+
+        assert "only supported on Windows" in capsys.readouterr().out
+
+    def test_no_arguments_starts_app(self) -> None:
+        """Test running without arguments shows the splash and runs the app."""
+        splash_module = MagicMock()
+        app_module = MagicMock()
+        with patch.dict(
+            "sys.modules",
+            {
+                "elivroimagine.splash": splash_module,
+                "elivroimagine.app": app_module,
+            },
+        ):
+            assert main([]) == 0
+
+        splash_module.SplashScreen.return_value.show.assert_called_once()
+        app_module.ElivroImagineApp.return_value.run.assert_called_once()
@@ -67,6 +67,28 @@ class TestRecorderStartStop:
         assert isinstance(audio, np.ndarray)
         assert duration >= 1.0
 
+    def test_stop_recording_discards_short_audio(
+        self, mock_sounddevice: MagicMock
+    ) -> None:
+        """Recordings shorter than min_duration return an empty array."""
+        from elivroimagine.config import RecordingConfig
+        from elivroimagine.recorder import AudioRecorder
+
+        config = RecordingConfig()
+        recorder = AudioRecorder(config)
+
+        recorder._recording = True
+        recorder._start_time = time.time() - 0.2
+        recorder._audio_data = [np.array([0.1, 0.2, 0.3], dtype=np.float32)]
+
+        result = recorder.stop_recording(min_duration=0.5)
+
+        assert result is not None
+        audio, duration = result
+        assert audio.size == 0
+        assert duration < 0.5
+        assert recorder._audio_data == []
+
     def test_stop_recording_when_not_recording(
         self, mock_sounddevice: MagicMock
     ) -> None:
@@ -199,6 +221,24 @@ class TestRecorderConfig:
 
         assert recorder.config.max_duration_seconds == 60
 
+    def test_update_config_changes_microphone(
+        self, mock_sounddevice: MagicMock
+    ) -> None:
+        """A microphone set via update_config is used by the next recording."""
+        from elivroimagine.config import RecordingConfig
+        from elivroimagine.recorder import AudioRecorder
+
+        recorder = AudioRecorder(RecordingConfig())
+        recorder.update_config(RecordingConfig(microphone_id="3"))
+
+        recorder.start_recording()
+        deadline = time.monotonic() + 2.0
+        while not mock_sounddevice.InputStream.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        recorder.stop_recording()
+
+        assert mock_sounddevice.InputStream.call_args_list[0].kwargs["device"] == 3
+
 
 class TestRecorderThreadSafety:
     """Test recorder thread safety."""
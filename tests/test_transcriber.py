@@ -96,6 +96,33 @@ class TestTranscriberNormalization:
         # Values should be unchanged
         np.testing.assert_array_almost_equal(transcribed_audio, original_audio)
 
+    def test_float32_audio_passed_without_copy(
+        self, mock_faster_whisper: MagicMock
+    ) -> None:
+        """Float32 audio already in range should reach the model as-is."""
+        config = WhisperConfig(model_size="tiny")
+        transcriber = Transcriber(config)
+
+        audio = np.array([0, 0.5, -0.5], dtype=np.float32)
+
+        transcriber.transcribe(audio)
+
+        call_args = mock_faster_whisper.return_value.transcribe.call_args
+        assert call_args[0][0] is audio
+
+    def test_normalization_does_not_modify_input(
+        self, mock_faster_whisper: MagicMock
+    ) -> None:
+        """Rescaling out-of-range audio should leave the caller's array intact."""
+        config = WhisperConfig(model_size="tiny")
+        transcriber = Transcriber(config)
+
+        audio = np.array([0, 2.0, -4.0], dtype=np.float32)
+
+        transcriber.transcribe(audio)
+
+        np.testing.assert_array_equal(audio, [0, 2.0, -4.0])
+
 
 class TestDeviceDetection:
     """Tests for device detection."""
@@ -125,6 +152,22 @@ class TestDeviceDetection:
             assert compute == "float16"
 
 
+class TestLocalWorkers:
+    """Tests for concurrent local transcription workers."""
+
+    def test_model_loaded_with_configured_workers(
+        self, mock_faster_whisper: MagicMock
+    ) -> None:
+        """WhisperModel gets one worker per allowed concurrent transcription."""
+        transcriber = Transcriber(
+            WhisperConfig(model_size="tiny"),
+            transcription_config=TranscriptionConfig(max_workers=2),
+        )
+        transcriber._ensure_model()
+
+        assert mock_faster_whisper.call_args[1]["num_workers"] == 2
+
+
 class TestCudaFallback:
     """Tests for CUDA-to-CPU fallback when GPU libs are missing."""
 